@@ -5,13 +5,6 @@ PowerPoint to Video Converter with Azure Speech Services
 This script automates the complete process of converting a PowerPoint presentation
 to a video with narration using Azure Speech Services.
 
-    print("📊 Files created:")
-    print("  • ppt_to_mp4WITH_AZURE_AUDIO.mp4 - Final video")
-    print("  • exported_slides/ - Individual slide images")
-    print("  • audio_clips/ - Generated audio files")
-    print("  • slide_images/ - Processed slide images")
-    print("  • test_audio/ - Audio test files")th narration using Azure Speech Services.
-
 Requirements:
 - PowerPoint presentation file: content_maintenance_process.pptx
 - Azure Speech Services credentials in .env file
@@ -24,10 +17,10 @@ Process:
 """
 
 import os
+import stat
 import sys
-import subprocess
+import threading
 import time
-from pathlib import Path
 from dotenv import load_dotenv
 
 # Import utility functions
@@ -71,13 +64,19 @@ def check_prerequisites():
         return False
     print(f"✅ Found PowerPoint file: {pptx_file}")
     
-    # Check for required Python files
-    required_files = ["utilities/generate_from_slides.py", "utilities/generate_audio.py", "utilities/generate_with_azure_audio.py"]
+    # Check for required Python files - one directory scan instead of a
+    # stat() call per file
+    required_files = ["generate_from_slides.py", "generate_audio.py", "generate_with_azure_audio.py"]
+    try:
+        with os.scandir("utilities") as it:
+            utility_files = {entry.name for entry in it if entry.is_file()}
+    except OSError:
+        utility_files = set()
     for file in required_files:
-        if not os.path.exists(file):
-            print(f"❌ ERROR: Required Python file not found: {file}")
+        if file not in utility_files:
+            print(f"❌ ERROR: Required Python file not found: utilities/{file}")
             return False
-        print(f"✅ Found: {file}")
+        print(f"✅ Found: utilities/{file}")
     
     print("✅ All prerequisites met!")
     return True
@@ -98,17 +97,21 @@ def check_output_files():
     
     all_found = True
     for file_path in expected_files:
-        if os.path.exists(file_path):
-            if os.path.isdir(file_path):
-                file_count = len([f for f in os.listdir(file_path) if not f.startswith('.')])
-                print(f"✅ Found directory: {file_path} ({file_count} files)")
-            else:
-                file_size = os.path.getsize(file_path)
-                print(f"✅ Found file: {file_path} ({file_size:,} bytes)")
-        else:
+        # One stat() per path instead of exists + isdir + getsize
+        try:
+            path_stat = os.stat(file_path)
+        except OSError:
             print(f"❌ Missing: {file_path}")
             all_found = False
-    
+            continue
+
+        if stat.S_ISDIR(path_stat.st_mode):
+            with os.scandir(file_path) as it:
+                file_count = sum(1 for entry in it if not entry.name.startswith('.'))
+            print(f"✅ Found directory: {file_path} ({file_count} files)")
+        else:
+            print(f"✅ Found file: {file_path} ({path_stat.st_size:,} bytes)")
+
     return all_found
 
 def main():
@@ -123,30 +126,46 @@ def main():
         print("\n❌ Prerequisites not met. Please fix the issues above and try again.")
         return False
     
-    # Step 1: Export slides from PowerPoint
+    # Steps 1 + 2 run concurrently: slide export is CPU/subprocess-bound and
+    # the Azure Speech test is network-bound, and neither depends on the
+    # other. Overlapping them means the Azure websocket is already warm by
+    # the time the slides are ready for narration.
     print_step(1, "Exporting slides from PowerPoint as images")
+    print_step(2, "Testing Azure Speech Services (in parallel)")
+
+    audio_test_result = {}
+
+    def run_audio_test():
+        try:
+            audio_test_result['success'] = test_audio_generation()
+        except Exception as e:
+            audio_test_result['error'] = e
+
+    audio_thread = threading.Thread(target=run_audio_test)
+    audio_thread.start()
+
     try:
         intermediate_video = export_slides()
         if not intermediate_video:
             print("❌ Failed to export slides.")
+            audio_thread.join()
             return False
         print("✅ Slides exported successfully!")
     except Exception as e:
         print(f"❌ Error exporting slides: {e}")
+        audio_thread.join()
         return False
-    
-    # Step 2: Test Azure Speech Services
-    print_step(2, "Testing Azure Speech Services")
-    try:
-        success = test_audio_generation()
-        if not success:
-            print("❌ Azure Speech Services test failed. Please check your credentials in .env file.")
-            return False
-        print("✅ Azure Speech Services test passed!")
-    except Exception as e:
-        print(f"❌ Error testing Azure Speech Services: {e}")
+
+    audio_thread.join()
+    if 'error' in audio_test_result:
+        print(f"❌ Error testing Azure Speech Services: {audio_test_result['error']}")
         return False
-    
+    if not audio_test_result.get('success'):
+        print("❌ Azure Speech Services test failed. Please check your credentials in .env file.")
+        return False
+    print("✅ Azure Speech Services test passed!")
+
+
     # Step 3: Generate final video with audio
     print_step(3, "Generating final video with Azure Speech narration")
     try:
@@ -191,7 +210,7 @@ def main():
     print("  • exported_slides/ - Individual slide images")
     print("  • audio_clips/ - Generated audio files")
     print("\n🧹 Cleaned up:")
-    print("  • slide_images/ - Temporary processed slide images")
+    print("  • slide_images/ - Temporary per-slide video clips")
     print("  • test_audio/ - Temporary audio test files")
     if intermediate_video:
         intermediate_name = os.path.basename(intermediate_video)
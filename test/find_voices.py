@@ -5,73 +5,109 @@ Azure Speech Voices List
 This script displays a clean list of all available voice names in your Azure Speech region.
 """
 
+import json
 import os
 import sys
+import time
 from dotenv import load_dotenv
 import azure.cognitiveservices.speech as speechsdk
 
+# The voice catalog changes rarely, so the fetched list is cached on disk
+# and reused for a day - repeat runs skip the Azure round-trip entirely
+VOICES_CACHE_PATH = ".voices.cache"
+VOICES_CACHE_MAX_AGE = 24 * 3600  # seconds
+
+def load_cached_voices(region):
+    """Return the cached voices-by-locale dict if fresh, else None"""
+    try:
+        with open(VOICES_CACHE_PATH) as f:
+            cached = json.load(f)
+        if (cached.get("region") == region
+                and time.time() - cached.get("fetched_at", 0) < VOICES_CACHE_MAX_AGE):
+            return cached["voices_by_locale"]
+    except (OSError, ValueError, KeyError):
+        pass
+    return None
+
+def save_voices_cache(region, voices_by_locale):
+    """Store the voices-by-locale dict with a fetch timestamp"""
+    try:
+        with open(VOICES_CACHE_PATH, "w") as f:
+            json.dump({"region": region,
+                       "fetched_at": time.time(),
+                       "voices_by_locale": voices_by_locale}, f)
+    except OSError:
+        pass
+
+def fetch_voices_by_locale(speech_key, region):
+    """Fetch the voice list from Azure, grouped by locale"""
+    speech_config = speechsdk.SpeechConfig(subscription=speech_key, region=region)
+    synthesizer = speechsdk.SpeechSynthesizer(speech_config=speech_config, audio_config=None)
+
+    print(f"Fetching available voices for region '{region}'...")
+    result = synthesizer.get_voices_async().get()
+
+    if result.reason != speechsdk.ResultReason.VoicesListRetrieved:
+        print(f"❌ Failed to retrieve voices: {result.reason}")
+        return None
+
+    # Group voices by locale
+    voices_by_locale = {}
+    for voice in result.voices:
+        voices_by_locale.setdefault(voice.locale, []).append(voice.name)
+    return voices_by_locale
+
 def list_available_voices(speech_key, region):
     """Get and display list of available voice names"""
     try:
-        # Create speech config
-        speech_config = speechsdk.SpeechConfig(subscription=speech_key, region=region)
-        
-        # Create synthesizer
-        synthesizer = speechsdk.SpeechSynthesizer(speech_config=speech_config, audio_config=None)
-        
-        # Get voices
-        print(f"Fetching available voices for region '{region}'...")
-        result = synthesizer.get_voices_async().get()
-        
-        if result.reason == speechsdk.ResultReason.VoicesListRetrieved:
-            voices = result.voices
-            
-            # Group voices by locale
-            voices_by_locale = {}
-            for voice in voices:
-                locale = voice.locale
-                if locale not in voices_by_locale:
-                    voices_by_locale[locale] = []
-                voices_by_locale[locale].append(voice.name)
-            
-            # Display English voices only
-            en_locales = [locale for locale in voices_by_locale.keys() if locale.startswith('en-')]
-            
-            print(f"\n" + "=" * 60)
-            print(f" ENGLISH VOICES ({len([v for locale in en_locales for v in voices_by_locale[locale]])} total)")
-            print("=" * 60)
-            
-            for locale in sorted(en_locales):
-                print(f"\n{locale} ({len(voices_by_locale[locale])} voices):")
-                for voice_name in sorted(voices_by_locale[locale]):
-                    # Clean up the voice name for display
-                    clean_name = voice_name.replace("Microsoft Server Speech Text to Speech Voice (", "").replace(")", "")
-                    if ", " in clean_name:
-                        parts = clean_name.split(", ")
-                        if len(parts) >= 2:
-                            clean_name = parts[1]  # Just the voice name part
-                    print(f"  {clean_name}")
-            
-            print(f"\n" + "=" * 60)
-            print(f" USAGE EXAMPLES")
-            print("=" * 60)
-            print("Copy any voice name above and use it in your .env file:")
-            print("  VOICE_NAME=en-US-JennyNeural")
-            print("  VOICE_NAME=en-US-AriaNeural")
-            print("  VOICE_NAME=en-GB-SoniaNeural")
-            print("\nRecommended voices for different styles:")
-            print("  • Conversational: en-US-JennyNeural, en-US-AriaNeural")
-            print("  • Professional: en-US-DavisNeural, en-US-JaneNeural")
-            print("  • Friendly: en-US-AshleyNeural, en-US-BrandonNeural")
-            print("  • British accent: en-GB-SoniaNeural, en-GB-RyanNeural")
-            print("  • Australian accent: en-AU-NatashaNeural, en-AU-WilliamNeural")
-            
-            return True
-            
+        # Use the cached list when it's less than a day old - no speech
+        # config, synthesizer, or network call needed
+        voices_by_locale = load_cached_voices(region)
+        if voices_by_locale is not None:
+            print(f"Using cached voice list for region '{region}' (refreshed daily)")
         else:
-            print(f"❌ Failed to retrieve voices: {result.reason}")
-            return False
-            
+            voices_by_locale = fetch_voices_by_locale(speech_key, region)
+            if voices_by_locale is None:
+                return False
+            save_voices_cache(region, voices_by_locale)
+
+        # Display English voices only, sorted once up front instead of
+        # inside the print loop
+        sorted_locales = sorted(l for l in voices_by_locale if l.startswith('en-'))
+        per_locale = {l: sorted(voices_by_locale[l]) for l in sorted_locales}
+        total = sum(len(v) for v in per_locale.values())
+
+        print(f"\n" + "=" * 60)
+        print(f" ENGLISH VOICES ({total} total)")
+        print("=" * 60)
+
+        for locale in sorted_locales:
+            print(f"\n{locale} ({len(per_locale[locale])} voices):")
+            for voice_name in per_locale[locale]:
+                # Clean up the voice name for display
+                clean_name = voice_name.replace("Microsoft Server Speech Text to Speech Voice (", "").replace(")", "")
+                if ", " in clean_name:
+                    parts = clean_name.split(", ")
+                    if len(parts) >= 2:
+                        clean_name = parts[1]  # Just the voice name part
+                print(f"  {clean_name}")
+
+        print(f"\n" + "=" * 60)
+        print(f" USAGE EXAMPLES")
+        print("=" * 60)
+        print("Copy any voice name above and use it in your .env file:")
+        print("  VOICE_NAME=en-US-JennyNeural")
+        print("  VOICE_NAME=en-US-AriaNeural")
+        print("  VOICE_NAME=en-GB-SoniaNeural")
+        print("\nRecommended voices for different styles:")
+        print("  • Conversational: en-US-JennyNeural, en-US-AriaNeural")
+        print("  • Professional: en-US-DavisNeural, en-US-JaneNeural")
+        print("  • Friendly: en-US-AshleyNeural, en-US-BrandonNeural")
+        print("  • British accent: en-GB-SoniaNeural, en-GB-RyanNeural")
+        print("  • Australian accent: en-AU-NatashaNeural, en-AU-WilliamNeural")
+
+        return True
+
     except Exception as e:
         print(f"❌ Error fetching voices: {str(e)}")
         return False
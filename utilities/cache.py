@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Content-hash cache for slide frames and narration audio
+
+Re-running the pipeline normally redoes every Azure synthesis call and
+every Pillow resize even when nothing changed. Keying cached results by a
+SHA-256 of their inputs (slide image bytes, narration text + voice) makes
+reruns O(changed slides) instead of O(all slides).
+
+Cache entries live under .cache/ next to an index.json that records what
+each key maps to, mostly for debugging and manual cleanup.
+"""
+
+import hashlib
+import json
+import shutil
+from pathlib import Path
+
+CACHE_DIR = Path(".cache")
+INDEX_PATH = CACHE_DIR / "index.json"
+
+def content_key(*parts):
+    """
+    Build a SHA-256 cache key from a mix of strings and bytes
+
+    Args:
+        *parts: str or bytes values that together identify the cached work
+
+    Returns:
+        str: Hex digest usable as a cache filename
+    """
+    hasher = hashlib.sha256()
+    for part in parts:
+        if isinstance(part, str):
+            part = part.encode('utf-8')
+        hasher.update(part)
+        hasher.update(b'\x00')  # separator so ("ab","c") != ("a","bc")
+    return hasher.hexdigest()
+
+def cache_path(key, ext):
+    """
+    Get the path for a cache entry, creating the cache directory if needed
+
+    Args:
+        key (str): Content hash from content_key()
+        ext (str): File extension including the dot (e.g. ".wav")
+
+    Returns:
+        Path: Location of the cache entry (may not exist yet)
+    """
+    CACHE_DIR.mkdir(exist_ok=True)
+    return CACHE_DIR / f"{key}{ext}"
+
+def record_entry(key, description):
+    """
+    Record what a cache key maps to in the index JSON
+
+    Best-effort: concurrent writers can race, so failures are ignored -
+    the index is informational and not needed for cache hits.
+
+    Args:
+        key (str): Content hash from content_key()
+        description (str): Human-readable note about what was cached
+    """
+    try:
+        index = {}
+        if INDEX_PATH.exists():
+            index = json.loads(INDEX_PATH.read_text())
+        index[key] = description
+        INDEX_PATH.write_text(json.dumps(index, indent=2))
+    except Exception:
+        pass
+
+def clear_cache():
+    """Remove all cache entries and the index"""
+    if not CACHE_DIR.exists():
+        return
+    for entry in CACHE_DIR.iterdir():
+        try:
+            # Exported-deck entries are directories (<key>.slides)
+            if entry.is_dir():
+                shutil.rmtree(entry)
+            else:
+                entry.unlink()
+        except OSError as e:
+            print(f"Warning: could not remove cache entry {entry}: {e}")
+    print(f"Cache cleared: {CACHE_DIR}/")
@@ -14,6 +14,7 @@ What gets cleaned up:
 
 import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 
 def remove_directory(dir_path):
     """Remove a directory and all its contents"""
@@ -31,17 +32,21 @@ def remove_directory(dir_path):
 
 def get_directory_size(dir_path):
     """Get the total size of a directory in bytes"""
-    if not os.path.exists(dir_path):
-        return 0
-    
+    # Recursive scandir: each DirEntry carries its stat result from the
+    # directory read, so this avoids a separate stat() call per file
     total_size = 0
-    for dirpath, dirnames, filenames in os.walk(dir_path):
-        for filename in filenames:
-            file_path = os.path.join(dirpath, filename)
-            try:
-                total_size += os.path.getsize(file_path)
-            except (OSError, FileNotFoundError):
-                pass
+    try:
+        with os.scandir(dir_path) as it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        total_size += get_directory_size(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        total_size += entry.stat(follow_symlinks=False).st_size
+                except OSError:
+                    pass
+    except OSError:
+        return 0
     return total_size
 
 def format_size(size_bytes):
@@ -130,16 +135,21 @@ def main():
         print("Cleanup cancelled.")
         return
     
-    # Perform cleanup
+    # Perform cleanup - the directories are independent, so the rmtree
+    # calls (I/O-bound unlink syscalls) run concurrently
     print("\n🧹 Cleaning up...")
     success_count = 0
     total_removed = 0
-    
-    for dir_name in dirs_to_remove:
+
+    def remove_one(dir_name):
         size_before = get_directory_size(dir_name)
-        if remove_directory(dir_name):
-            success_count += 1
-            total_removed += size_before
+        return remove_directory(dir_name), size_before
+
+    with ThreadPoolExecutor(max_workers=len(dirs_to_remove)) as executor:
+        for removed, size_before in executor.map(remove_one, dirs_to_remove):
+            if removed:
+                success_count += 1
+                total_removed += size_before
     
     print(f"\n✅ Cleanup completed!")
     print(f"📊 Freed up: {format_size(total_removed)}")
@@ -4,7 +4,6 @@ Utility functions for filename handling
 """
 
 import os
-from pathlib import Path
 
 def generate_output_filename(pptx_file, suffix=""):
     """
@@ -22,16 +21,11 @@ def generate_output_filename(pptx_file, suffix=""):
         "content_maintenance_process.pptx" -> "content_maintenance_process_WITH_AZURE_AUDIO.mp4"
         "presentation.ppt" -> "presentation_WITH_AZURE_AUDIO.mp4"
     """
-    # Get the file path object
-    pptx_path = Path(pptx_file)
-    
-    # Get the stem (filename without extension)
-    base_name = pptx_path.stem
-    
+    # Plain string ops - no need to build a Path object just for the stem
+    base_name = os.path.splitext(os.path.basename(pptx_file))[0]
+
     # Create the new filename with suffix and .mp4 extension
-    output_filename = f"{base_name}{suffix}.mp4"
-    
-    return output_filename
+    return f"{base_name}{suffix}.mp4"
 
 def get_powerpoint_file():
     """Get the PowerPoint file from environment or default"""
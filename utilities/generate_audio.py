@@ -1,96 +1,307 @@
+#!/usr/bin/env python3
+"""
+Azure Speech Services audio generation
+
+Connection handling: one SpeechConfig is built per process and each worker
+thread keeps a long-lived SpeechSynthesizer per voice (see get_synth). The
+synthesizer is created with no bound audio output, so a single Azure
+websocket session is reused for every utterance on that thread and results
+are written out through AudioDataStream. This means only the first request
+per thread pays the TLS/auth/handshake cost - the same effect as routing
+all slides through one persistent output stream, without giving up the
+per-utterance WAV files the video assembly step consumes.
+"""
+
+import asyncio
 import os
+import shutil
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 import azure.cognitiveservices.speech as speechsdk
 from dotenv import load_dotenv
 
+# Import cache helpers with fallback for relative import
+try:
+    from . import cache
+except ImportError:
+    import cache
+
 # Load environment variables
 load_dotenv()
 
+# Wire format for synthesized audio. Narration-grade MP3 is several times
+# smaller than the default 16-bit PCM, so each clip's download from Azure
+# finishes sooner; ffmpeg decodes it transparently during clip encoding.
+# Set TTS_AUDIO_FORMAT=wav to keep uncompressed PCM output.
+_AUDIO_FORMAT = os.environ.get('TTS_AUDIO_FORMAT', 'mp3').lower()
+AUDIO_EXT = '.mp3' if _AUDIO_FORMAT == 'mp3' else '.wav'
+
+# Cached speech config - built once and shared by every synthesis call
+_speech_config = None
+
+# Per-thread synthesizer cache keyed by voice name. Reusing a synthesizer keeps
+# the Azure websocket open, so only the first request per thread pays the
+# TLS/auth/handshake cost (1-4s). The SDK synthesizer is not thread-safe,
+# hence one cache per thread rather than a single shared instance.
+_thread_local = threading.local()
+
+def get_speech_config():
+    """
+    Get the shared Azure SpeechConfig, creating it on first use
+
+    Returns:
+        speechsdk.SpeechConfig or None if credentials are missing
+    """
+    global _speech_config
+    if _speech_config is not None:
+        return _speech_config
+
+    # Get Azure Speech credentials
+    speech_key = os.environ.get('SPEECH_KEY')
+    if not speech_key:
+        print("Error: SPEECH_KEY not found in environment variables")
+        return None
+
+    # Use the endpoint from .env verbatim - the SDK connects straight to it,
+    # so any region works and users automatically hit their nearest one
+    # instead of a hard-coded US region
+    endpoint = os.environ.get('ENDPOINT', '')
+    if endpoint:
+        print(f"Using Azure Speech endpoint: {endpoint}")
+        _speech_config = speechsdk.SpeechConfig(subscription=speech_key, endpoint=endpoint)
+    else:
+        # Fallback to eastus2 for backward compatibility
+        speech_region = "eastus2"
+        print(f"Warning: ENDPOINT not set in .env, using default region: {speech_region}")
+        _speech_config = speechsdk.SpeechConfig(subscription=speech_key, region=speech_region)
+    _speech_config.speech_synthesis_voice_name = os.environ.get('VOICE_NAME', 'en-US-AvaMultilingualNeural')
+    if _AUDIO_FORMAT == 'mp3':
+        _speech_config.set_speech_synthesis_output_format(
+            speechsdk.SpeechSynthesisOutputFormat.Audio24Khz48KBitRateMonoMp3)
+    return _speech_config
+
+def get_synth(voice_name=None):
+    """
+    Get a cached SpeechSynthesizer for the given voice (per thread)
+
+    The synthesizer is created without an audio output so it can be reused
+    across utterances; callers write the result via AudioDataStream.
+
+    Args:
+        voice_name (str): Voice to use for synthesis (if None, uses .env setting)
+
+    Returns:
+        speechsdk.SpeechSynthesizer or None if credentials are missing
+    """
+    speech_config = get_speech_config()
+    if speech_config is None:
+        return None
+
+    if voice_name is None:
+        voice_name = speech_config.speech_synthesis_voice_name
+
+    cache = getattr(_thread_local, 'synth_cache', None)
+    if cache is None:
+        cache = _thread_local.synth_cache = {}
+
+    synthesizer = cache.get(voice_name)
+    if synthesizer is None:
+        speech_config.speech_synthesis_voice_name = voice_name
+        # audio_config=None keeps the output unbound so the synthesizer can be reused
+        synthesizer = speechsdk.SpeechSynthesizer(speech_config=speech_config, audio_config=None)
+        cache[voice_name] = synthesizer
+
+    return synthesizer
+
+def discard_synth(voice_name=None):
+    """
+    Drop this thread's cached synthesizer so the next get_synth rebuilds it
+
+    Used when a synthesis attempt fails: a long-running batch can outlive
+    the auth token baked into the websocket session, and a rebuilt
+    synthesizer reconnects with a fresh one.
+
+    Args:
+        voice_name (str): Voice whose synthesizer to drop (if None, uses .env setting)
+    """
+    speech_config = get_speech_config()
+    if voice_name is None and speech_config is not None:
+        voice_name = speech_config.speech_synthesis_voice_name
+    synth_cache = getattr(_thread_local, 'synth_cache', None)
+    if synth_cache is not None:
+        synth_cache.pop(voice_name, None)
+
+def warmup():
+    """
+    Establish the Azure websocket before the first real synthesis request
+
+    The first call on a new connection pays the TLS + auth + handshake cost,
+    so synthesizing a tiny utterance up front keeps it off the critical path.
+    """
+    try:
+        synthesizer = get_synth()
+        if synthesizer is not None:
+            synthesizer.speak_text_async(" ").get()
+            print("Azure Speech connection warmed up")
+    except Exception as e:
+        print(f"Warning: Azure Speech warmup failed: {e}")
+
 def generate_audio_file(text, output_path, voice_name=None):
     """
     Generate audio file from text using Azure Speech Services
-    
+
     Args:
         text (str): Text to convert to speech
-        output_path (str): Path where to save the audio file (should end with .wav)
+        output_path (str): Path where to save the audio file (should end with
+            AUDIO_EXT - .mp3 by default, .wav when TTS_AUDIO_FORMAT=wav)
         voice_name (str): Voice to use for synthesis (if None, uses .env setting)
-    
+
     Returns:
         bool: True if successful, False otherwise
     """
     try:
-        # Get Azure Speech credentials
-        speech_key = os.environ.get('SPEECH_KEY')
-        
-        # Extract region from endpoint in .env file
-        endpoint = os.environ.get('ENDPOINT', '')
-        if "eastus2" in endpoint:
-            speech_region = "eastus2"
-        elif "eastus" in endpoint:
-            speech_region = "eastus"
-        elif "westus2" in endpoint:
-            speech_region = "westus2"
-        elif "westus" in endpoint:
-            speech_region = "westus"
-        else:
-            # Fallback to eastus2 for backward compatibility
-            speech_region = "eastus2"
-            print(f"Warning: Could not determine region from ENDPOINT={endpoint}, using default: {speech_region}")
-        
-        print(f"Using Azure Speech region: {speech_region}")
-        
-        # Get voice name from .env if not provided
-        if voice_name is None:
-            voice_name = os.environ.get('VOICE_NAME', 'en-US-AvaMultilingualNeural')
-        
-        if not speech_key:
-            print("Error: SPEECH_KEY not found in environment variables")
+        # Check the content-hash cache first - identical text + voice means
+        # identical audio, so a rerun can skip the Azure round-trip entirely
+        effective_voice = voice_name or os.environ.get('VOICE_NAME', 'en-US-AvaMultilingualNeural')
+        cache_key = cache.content_key("tts", text, effective_voice, _AUDIO_FORMAT)
+        cached_audio = cache.cache_path(cache_key, AUDIO_EXT)
+        if cached_audio.exists():
+            shutil.copy(cached_audio, output_path)
+            print(f"Audio cache hit, reused: {output_path}")
+            return True
+
+        # Get the cached synthesizer for this thread/voice (reuses the websocket)
+        speech_synthesizer = get_synth(voice_name)
+        if speech_synthesizer is None:
             return False
-        
-        # Create speech config
-        speech_config = speechsdk.SpeechConfig(subscription=speech_key, region=speech_region)
-        speech_config.speech_synthesis_voice_name = voice_name
-        
-        # Configure audio output to file
-        audio_config = speechsdk.audio.AudioOutputConfig(filename=output_path)
-        
-        # Create synthesizer
-        speech_synthesizer = speechsdk.SpeechSynthesizer(speech_config=speech_config, audio_config=audio_config)
-        
+
         print(f"Generating audio for: {text[:50]}...")
-        
-        # Synthesize speech
-        speech_synthesis_result = speech_synthesizer.speak_text_async(text).get()
-        
-        if speech_synthesis_result.reason == speechsdk.ResultReason.SynthesizingAudioCompleted:
-            print(f"Audio saved successfully: {output_path}")
-            return True
-        elif speech_synthesis_result.reason == speechsdk.ResultReason.Canceled:
-            cancellation_details = speech_synthesis_result.cancellation_details
+
+        # Azure throttles concurrent bursts with 429s, and those surface
+        # here as canceled streams - retry with exponential backoff so a
+        # throttled request in the batch recovers instead of failing the slide
+        for attempt in range(3):
+            # Start streaming synthesis - this returns as soon as audio begins
+            # arriving instead of blocking for the whole utterance
+            speech_synthesis_result = speech_synthesizer.start_speaking_text_async(text).get()
+            stream = speechsdk.AudioDataStream(speech_synthesis_result)
+
+            # save_to_wav_file drains the stream as chunks arrive, so bytes hit
+            # disk while Azure is still synthesizing the tail of the utterance
+            # (despite the name it writes the raw stream bytes, MP3 included)
+            stream.save_to_wav_file(output_path)
+
+            if stream.status != speechsdk.StreamStatus.Canceled:
+                break
+
+            cancellation_details = stream.cancellation_details
             print(f"Speech synthesis canceled: {cancellation_details.reason}")
             if cancellation_details.reason == speechsdk.CancellationReason.Error:
                 if cancellation_details.error_details:
                     print(f"Error details: {cancellation_details.error_details}")
-            return False
+            if attempt < 2:
+                delay = 2 ** attempt
+                print(f"Retrying synthesis in {delay}s...")
+                time.sleep(delay)
+                # Rebuild the synthesizer for the retry - the failure may be
+                # an expired auth token on the reused websocket session
+                discard_synth(voice_name)
+                speech_synthesizer = get_synth(voice_name)
+                if speech_synthesizer is None:
+                    return False
         else:
-            print(f"Unexpected result: {speech_synthesis_result.reason}")
             return False
-            
+
+        # Store the result for future reruns with the same text + voice
+        shutil.copy(output_path, cached_audio)
+        cache.record_entry(cache_key, f"tts: {text[:60]} ({effective_voice})")
+
+        print(f"Audio saved successfully: {output_path}")
+        return True
+
     except Exception as e:
         print(f"Error generating audio: {e}")
         return False
 
+def _synth_one(item):
+    """Synthesize a single (text, output_path) pair - helper for the batch function"""
+    text, output_path = item
+    return generate_audio_file(text, output_path)
+
+def generate_audio_files_batch(items, max_workers=8):
+    """
+    Generate multiple audio files concurrently using Azure Speech Services
+
+    Synthesis is network-bound (websocket round trips to Azure), so running
+    requests in a thread pool overlaps the waiting and cuts total wall time
+    to roughly the longest single utterance instead of the sum of all of them.
+
+    Args:
+        items (list): List of (text, output_path) tuples to synthesize
+        max_workers (int): Maximum number of concurrent synthesis requests
+
+    Returns:
+        list: True/False success flag for each item, in input order
+    """
+    if not items:
+        return []
+
+    # Each worker builds its own synthesizer (the SDK synthesizer is not
+    # thread-safe, but construction is cheap once the config exists)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = list(executor.map(_synth_one, items))
+
+    success_count = sum(1 for r in results if r)
+    print(f"Batch synthesis complete: {success_count}/{len(items)} audio files generated")
+    return results
+
+async def generate_audio_files_async(items, max_workers=8):
+    """
+    Async variant of generate_audio_files_batch for event-loop callers
+
+    The Speech SDK is sync-only, so each synthesis call runs in a worker
+    thread via asyncio.to_thread; a semaphore caps concurrency. Useful when
+    a caller wants to overlap synthesis with other awaitable work (e.g.
+    slide export or encoding) instead of blocking on the whole batch.
+
+    Args:
+        items (list): List of (text, output_path) tuples to synthesize
+        max_workers (int): Maximum number of concurrent synthesis requests
+
+    Returns:
+        list: True/False success flag for each item, in input order
+    """
+    if not items:
+        return []
+
+    semaphore = asyncio.Semaphore(max_workers)
+
+    async def synth_one(item):
+        async with semaphore:
+            return await asyncio.to_thread(_synth_one, item)
+
+    results = await asyncio.gather(*[synth_one(item) for item in items])
+
+    success_count = sum(1 for r in results if r)
+    print(f"Batch synthesis complete: {success_count}/{len(items)} audio files generated")
+    return list(results)
+
 def test_audio_generation():
     """Test the audio generation function"""
     print("Testing Azure Speech Services...")
-    
+
+    # Open the Azure connection up front so slide synthesis starts warm
+    warmup()
+
     # Create test directory
     os.makedirs("test_audio", exist_ok=True)
-    
+
     test_text = "Hello, this is a test of the Azure Speech Services text to speech functionality."
-    output_file = "test_audio/test_azure_speech.wav"
-    
+    output_file = f"test_audio/test_azure_speech{AUDIO_EXT}"
+
     success = generate_audio_file(test_text, output_file)
-    
+
     if success:
         print(f"Test successful! Audio file created: {output_file}")
         # Check file size
@@ -104,4 +315,4 @@ def test_audio_generation():
 
 if __name__ == "__main__":
     # Test the function when script is run directly
-    test_audio_generation()
\ No newline at end of file
+    test_audio_generation()
@@ -1,73 +1,261 @@
+import io
 import os
+import posixpath
 import subprocess
 import re
-from pptx import Presentation
-from moviepy import ImageClip, concatenate_videoclips
-from PIL import Image
+import shutil
+import string
+import zipfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
+from lxml import etree
+from PIL import Image, ImageDraw, ImageFont
 import tempfile
 from dotenv import load_dotenv
 
 # Import utility functions
 try:
-    from .filename_utils import get_powerpoint_file, generate_output_filename
+    from . import cache
+    from .filename_utils import generate_output_filename
 except ImportError:
-    from filename_utils import get_powerpoint_file, generate_output_filename
+    import cache
+    from filename_utils import generate_output_filename
 
 # Load environment variables
 load_dotenv()
 
+# Compiled once - used to pull the slide number out of filenames for sorting
+_NUM_RE = re.compile(r'\d+')
+
+class PersistentSoffice:
+    """
+    Keep one headless LibreOffice process alive across conversions
+
+    A cold soffice start costs several seconds; for batch workflows the
+    daemon is launched once with a UNO socket listener and each document is
+    dispatched through it. Requires the python-uno bindings that ship with
+    LibreOffice - callers should fall back to one-shot soffice invocations
+    when they are unavailable (see get_soffice_daemon).
+    """
+
+    def __init__(self, port=2002):
+        self.port = port
+        self.process = None
+        self._desktop = None
+
+    def start(self):
+        """Launch the headless daemon and connect to it over the UNO socket"""
+        import uno  # raises ImportError when LibreOffice bindings are absent
+
+        if self.process is None:
+            self.process = subprocess.Popen([
+                "soffice", "--headless", "--invisible", "--norestore",
+                f'--accept=socket,host=localhost,port={self.port};urp;'
+            ], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+        # The daemon needs a moment before the socket accepts connections
+        local_context = uno.getComponentContext()
+        resolver = local_context.ServiceManager.createInstanceWithContext(
+            "com.sun.star.bridge.UnoUrlResolver", local_context)
+        for attempt in range(10):
+            try:
+                context = resolver.resolve(
+                    f"uno:socket,host=localhost,port={self.port};urp;"
+                    "StarOffice.ComponentContext")
+                break
+            except Exception:
+                import time
+                time.sleep(0.5)
+        else:
+            raise RuntimeError("Could not connect to soffice UNO socket")
+
+        self._desktop = context.ServiceManager.createInstanceWithContext(
+            "com.sun.star.frame.Desktop", context)
+
+    def convert_to_pdf(self, pptx_file, outdir="."):
+        """Convert a presentation to PDF through the running daemon"""
+        import uno
+        from com.sun.star.beans import PropertyValue
+
+        def prop(name, value):
+            p = PropertyValue()
+            p.Name = name
+            p.Value = value
+            return p
+
+        source_url = uno.systemPathToFileUrl(os.path.abspath(pptx_file))
+        pdf_path = os.path.join(outdir, os.path.splitext(os.path.basename(pptx_file))[0] + ".pdf")
+        target_url = uno.systemPathToFileUrl(os.path.abspath(pdf_path))
+
+        document = self._desktop.loadComponentFromURL(
+            source_url, "_blank", 0, (prop("Hidden", True),))
+        try:
+            document.storeToURL(target_url, (prop("FilterName", "impress_pdf_Export"),))
+        finally:
+            document.close(False)
+
+        return pdf_path if os.path.exists(pdf_path) else None
+
+    def stop(self):
+        """Terminate the daemon process"""
+        if self.process is not None:
+            self.process.terminate()
+            self.process = None
+        self._desktop = None
+
+# Lazily-started shared daemon; stays None when python-uno is unavailable
+_soffice_daemon = None
+_soffice_daemon_failed = False
+
+def get_soffice_daemon():
+    """Get the shared PersistentSoffice daemon, or None when unsupported"""
+    global _soffice_daemon, _soffice_daemon_failed
+    if _soffice_daemon_failed:
+        return None
+    if _soffice_daemon is None:
+        try:
+            daemon = PersistentSoffice()
+            daemon.start()
+            _soffice_daemon = daemon
+        except Exception as e:
+            print(f"Persistent LibreOffice daemon unavailable ({e}), using one-shot soffice")
+            _soffice_daemon_failed = True
+            return None
+    return _soffice_daemon
+
+def _scratch_dir():
+    """Directory for short-lived intermediates - RAM-backed when available.
+
+    The PDF written by soffice is read once by the rasterizer and deleted,
+    so putting it on tmpfs (/dev/shm) skips the disk round-trip entirely;
+    elsewhere fall back to the system temp directory.
+    """
+    if os.path.isdir('/dev/shm'):
+        return '/dev/shm'
+    return tempfile.gettempdir()
+
+def _pdf_page_count(pdf_path):
+    """Get a PDF's page count via pdfinfo, or None if unavailable"""
+    try:
+        info = subprocess.run(["pdfinfo", pdf_path], stdout=subprocess.PIPE,
+                              stderr=subprocess.DEVNULL, timeout=30)
+    except (FileNotFoundError, subprocess.TimeoutExpired):
+        return None
+    for line in info.stdout.decode(errors='replace').splitlines():
+        if line.startswith("Pages:"):
+            try:
+                return int(line.split()[1])
+            except (IndexError, ValueError):
+                return None
+    return None
+
 def export_slides_as_images_libreoffice(pptx_file, output_dir="exported_slides"):
     """Try to export slides using LibreOffice + ImageMagick with better visual fidelity"""
     os.makedirs(output_dir, exist_ok=True)
     
     try:
-        # First, try to convert PowerPoint to PDF using LibreOffice with better settings
-        print("Converting PowerPoint to PDF using LibreOffice (with enhanced settings)...")
-        
-        # Use more advanced LibreOffice export settings for better visual fidelity
-        cmd_pdf = [
-            "soffice", "--headless", "--invisible", "--convert-to", "pdf",
-            "--outdir", ".",
-            "--writer",  # Force through writer for better conversion
-            pptx_file
-        ]
-        result_pdf = subprocess.run(cmd_pdf, capture_output=True, text=True, timeout=90)
-        
-        if result_pdf.returncode != 0:
-            print(f"LibreOffice enhanced PDF conversion failed: {result_pdf.stderr}")
-            # Try simpler conversion as fallback
-            cmd_pdf_simple = [
-                "soffice", "--headless", "--convert-to", "pdf",
-                "--outdir", ".", pptx_file
+        # The intermediate PDF goes to RAM-backed scratch space when the
+        # platform has it - it's read once and deleted
+        scratch = _scratch_dir()
+
+        # Prefer the persistent daemon - it amortizes LibreOffice's multi-
+        # second startup across conversions (needs the python-uno bindings)
+        pdf_path = None
+        daemon = get_soffice_daemon()
+        if daemon is not None:
+            try:
+                print("Converting PowerPoint to PDF via persistent LibreOffice daemon...")
+                pdf_path = daemon.convert_to_pdf(pptx_file, outdir=scratch)
+            except Exception as e:
+                print(f"Daemon conversion failed ({e}), falling back to one-shot soffice")
+                pdf_path = None
+
+        if pdf_path is None:
+            # One-shot conversion: spawn soffice just for this deck
+            print("Converting PowerPoint to PDF using LibreOffice (with enhanced settings)...")
+
+            # Skip the startup wizard/lock checks and discard stdout -
+            # soffice can emit arbitrary output over a long conversion and
+            # there's no reason to buffer it in Python. stderr is decoded
+            # only if the conversion fails.
+            # Name the Impress PDF export filter explicitly so soffice
+            # doesn't probe Writer/Calc filters first, and skip the old
+            # --writer detour (a .pptx never needs the Writer module)
+            cmd_pdf = [
+                "soffice", "--headless", "--invisible",
+                "--nologo", "--norestore", "--nolockcheck",
+                "--nodefault", "--nofirststartwizard",
+                "--convert-to", "pdf:impress_pdf_Export",
+                "--outdir", scratch,
+                pptx_file
             ]
-            result_pdf = subprocess.run(cmd_pdf_simple, capture_output=True, text=True, timeout=60)
-            
+            result_pdf = subprocess.run(cmd_pdf, stdout=subprocess.DEVNULL,
+                                        stderr=subprocess.PIPE, timeout=90)
+
             if result_pdf.returncode != 0:
-                print(f"LibreOffice simple PDF conversion also failed: {result_pdf.stderr}")
+                print(f"LibreOffice PDF conversion failed: {result_pdf.stderr.decode(errors='replace')}")
                 return False
-        
-        # Check if PDF was created
-        pdf_path = os.path.splitext(pptx_file)[0] + ".pdf"
-        if not os.path.exists(pdf_path):
-            print("PDF file was not created successfully")
-            return False
-        
+
+            # Check if PDF was created
+            pdf_path = os.path.join(scratch, os.path.splitext(os.path.basename(pptx_file))[0] + ".pdf")
+            if not os.path.exists(pdf_path):
+                print("PDF file was not created successfully")
+                return False
+
         print(f"PDF created successfully: {pdf_path}")
         
-        # Use ImageMagick with enhanced settings for better slide image quality
-        print("Converting PDF pages to individual slide images using ImageMagick (high quality)...")
+        # Rasterize PDF pages with pdftoppm - its C renderer is much faster
+        # per page than ImageMagick and avoids PowerPoint/COM entirely
+        print("Converting PDF pages to individual slide images using pdftoppm...")
         cmd_convert = [
-            "convert", 
-            "-density", "300",      # Higher resolution for better quality
-            "-quality", "95",       # Higher quality setting
-            "-background", "white", # Ensure white background
-            "-alpha", "remove",     # Remove transparency issues
-            "-colorspace", "RGB",   # Ensure RGB colorspace
+            "pdftoppm",
+            "-png",
+            "-scale-to", "1280",  # rasterize at the video frame size so the
+                                  # Pillow resize step has nothing to do
             pdf_path,
-            os.path.join(output_dir, "slide_%d.png")
+            os.path.join(output_dir, "slide")
         ]
-        
-        result_convert = subprocess.run(cmd_convert, capture_output=True, text=True, timeout=180)
+
+        try:
+            # Rasterize pages in parallel when we can learn the page count -
+            # pdftoppm renders serially, so one single-page worker per core
+            # turns the dominant rasterization cost into ~N-way parallel work
+            page_count = _pdf_page_count(pdf_path)
+            if page_count and page_count > 1:
+                print(f"Rasterizing {page_count} pages in parallel...")
+
+                def rasterize_page(page):
+                    return subprocess.run(
+                        ["pdftoppm", "-png", "-scale-to", "1280",
+                         "-f", str(page), "-l", str(page),
+                         pdf_path, os.path.join(output_dir, "slide")],
+                        stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, timeout=180)
+
+                with ThreadPoolExecutor(max_workers=min(page_count, os.cpu_count() or 1)) as pool:
+                    page_results = list(pool.map(rasterize_page, range(1, page_count + 1)))
+                failed = [r for r in page_results if r.returncode != 0]
+                result_convert = subprocess.CompletedProcess(
+                    cmd_convert, 1 if failed else 0,
+                    stderr=failed[0].stderr.decode(errors='replace') if failed else '')
+            else:
+                result_convert = subprocess.run(cmd_convert, capture_output=True, text=True, timeout=180)
+        except FileNotFoundError:
+            # pdftoppm not installed - fall back to ImageMagick
+            print("pdftoppm not found, falling back to ImageMagick convert...")
+            cmd_convert = [
+                "convert",
+                "-limit", "memory", "256MiB",  # cap pixel-cache RSS so a big
+                "-limit", "map", "512MiB",     # deck can't swap the host
+                "-density", "150",      # ~2x the 720p frame height - higher
+                                        # densities just get resized away
+                "-quality", "95",       # Higher quality setting
+                "-background", "white", # Ensure white background
+                "-alpha", "remove",     # Remove transparency issues
+                "-colorspace", "RGB",   # Ensure RGB colorspace
+                pdf_path,
+                os.path.join(output_dir, "slide_%d.png")
+            ]
+            result_convert = subprocess.run(cmd_convert, capture_output=True, text=True, timeout=180)
         
         # Clean up the temporary PDF
         if os.path.exists(pdf_path):
@@ -75,18 +263,22 @@ def export_slides_as_images_libreoffice(pptx_file, output_dir="exported_slides")
             print(f"Cleaned up temporary PDF: {pdf_path}")
         
         if result_convert.returncode == 0:
-            # Check how many slide images were created
-            slide_files = [f for f in os.listdir(output_dir) if f.startswith('slide_') and f.endswith('.png')]
-            print(f"Successfully exported {len(slide_files)} slides using LibreOffice + ImageMagick (enhanced)")
-            return True
+            # Check how many slide images were created (pdftoppm names them
+            # slide-1.png..., ImageMagick slide_1.png...)
+            slide_files = sorted(
+                (f for f in os.listdir(output_dir) if f.startswith('slide') and f.endswith('.png')),
+                key=lambda f: int(m.group()) if (m := _NUM_RE.search(f)) else 0)
+            print(f"Successfully exported {len(slide_files)} slides using LibreOffice + pdftoppm")
+            return slide_files
         else:
-            print(f"ImageMagick conversion failed: {result_convert.stderr}")
+            print(f"PDF rasterization failed: {result_convert.stderr}")
             return False
             
     except Exception as e:
         print(f"LibreOffice + ImageMagick enhanced export failed: {e}")
         # Clean up PDF if it exists
-        pdf_path = os.path.splitext(pptx_file)[0] + ".pdf"
+        pdf_path = os.path.join(_scratch_dir(),
+                                os.path.splitext(os.path.basename(pptx_file))[0] + ".pdf")
         if os.path.exists(pdf_path):
             os.remove(pdf_path)
         return False
@@ -121,10 +313,12 @@ def export_slides_as_images_macos_keynote(pptx_file, output_dir="exported_slides
         )
         
         if result.returncode == 0:
-            slide_files = [f for f in os.listdir(output_dir) if f.startswith('slide_') and f.endswith('.png')]
+            slide_files = sorted(
+                (f for f in os.listdir(output_dir) if f.startswith('slide_') and f.endswith('.png')),
+                key=lambda f: int(m.group()) if (m := _NUM_RE.search(f)) else 0)
             if len(slide_files) > 0:
                 print(f"Successfully exported {len(slide_files)} slides using macOS Keynote")
-                return True
+                return slide_files
             else:
                 print("Keynote export completed but no slide files found")
                 return False
@@ -147,11 +341,14 @@ def export_slides_as_images_powershell(pptx_file, output_dir="exported_slides"):
         $ppt.Visible = [Microsoft.Office.Core.MsoTriState]::msoFalse
         $presentation = $ppt.Presentations.Open("{os.path.abspath(pptx_file)}")
         
-        for ($i = 1; $i -le $presentation.Slides.Count; $i++) {{
-            $slide = $presentation.Slides.Item($i)
-            $slide.Export("{os.path.abspath(output_dir)}\\slide_$i.png", "PNG")
+        # Slide.Export is the only COM path that honors an explicit pixel
+        # size; SaveAs/ppSaveAsPNG would batch the export in one call but
+        # renders at PowerPoint's default DPI-dependent size, losing the
+        # exact 1280x720 frames the video pipeline fast-paths on
+        foreach ($slide in $presentation.Slides) {{
+            $slide.Export("{os.path.abspath(output_dir)}\\Slide$($slide.SlideIndex).PNG", "PNG", 1280, 720)
         }}
-        
+
         $presentation.Close()
         $ppt.Quit()
         [System.Runtime.Interopservices.Marshal]::ReleaseComObject($ppt)
@@ -170,8 +367,13 @@ def export_slides_as_images_powershell(pptx_file, output_dir="exported_slides"):
         os.unlink(ps_file)
         
         if result.returncode == 0:
-            print("Successfully exported slides using PowerShell")
-            return True
+            # Slide.Export names the files Slide1.PNG, Slide2.PNG, ...
+            slide_files = sorted(
+                (f for f in os.listdir(output_dir)
+                 if f.lower().startswith('slide') and f.lower().endswith('.png')),
+                key=lambda f: int(m.group()) if (m := _NUM_RE.search(f)) else 0)
+            print(f"Successfully exported {len(slide_files)} slides using PowerShell")
+            return slide_files
         else:
             print(f"PowerShell export failed: {result.stderr}")
             return False
@@ -179,227 +381,429 @@ def export_slides_as_images_powershell(pptx_file, output_dir="exported_slides"):
     except Exception as e:
         print(f"PowerShell export failed: {e}")
         return False
-    """Try to export slides using PowerShell (Windows only)"""
-    os.makedirs(output_dir, exist_ok=True)
-    
+
+# Precompiled XPaths for direct slide-content extraction - one C-level
+# traversal per slide instead of hundreds of python-pptx proxy-object
+# attribute accesses
+_PPTX_NS = {
+    'a': 'http://schemas.openxmlformats.org/drawingml/2006/main',
+    'p': 'http://schemas.openxmlformats.org/presentationml/2006/main',
+}
+_XP_SHAPES = etree.XPath('.//p:sp', namespaces=_PPTX_NS)
+_XP_PH_TYPE = etree.XPath('p:nvSpPr/p:nvPr/p:ph/@type', namespaces=_PPTX_NS)
+_XP_IS_PH = etree.XPath('boolean(p:nvSpPr/p:nvPr/p:ph)', namespaces=_PPTX_NS)
+_XP_PARAGRAPHS = etree.XPath('p:txBody/a:p', namespaces=_PPTX_NS)
+_XP_RUN_TEXT = etree.XPath('.//a:t/text()', namespaces=_PPTX_NS)
+_SLIDE_PART_RE = re.compile(r'ppt/slides/slide(\d+)\.xml$')
+
+# Part numbering (slide1.xml, slide2.xml, ...) does not track presentation
+# order once slides have been reordered or inserted, so the true order comes
+# from presentation.xml's sldIdLst joined against the relationship targets
+_R_NS = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships'
+_REL_NS = {'rel': 'http://schemas.openxmlformats.org/package/2006/relationships'}
+_SLD_IDS = etree.XPath('p:sldIdLst/p:sldId/@r:id',
+                       namespaces={**_PPTX_NS, 'r': _R_NS})
+_RELATIONSHIPS = etree.XPath('rel:Relationship', namespaces=_REL_NS)
+
+def _part_relationships(pptx_zip, part_name):
+    """Map relationship ids to (type, target) for one part's .rels XML"""
+    rels_part = posixpath.join(posixpath.dirname(part_name), '_rels',
+                               posixpath.basename(part_name) + '.rels')
     try:
-        # PowerShell script to export PowerPoint slides
-        ps_script = f'''
-        $ppt = New-Object -ComObject PowerPoint.Application
-        $ppt.Visible = [Microsoft.Office.Core.MsoTriState]::msoFalse
-        $presentation = $ppt.Presentations.Open("{os.path.abspath(pptx_file)}")
-        
-        for ($i = 1; $i -le $presentation.Slides.Count; $i++) {{
-            $slide = $presentation.Slides.Item($i)
-            $slide.Export("{os.path.abspath(output_dir)}\\slide_$i.png", "PNG")
-        }}
-        
-        $presentation.Close()
-        $ppt.Quit()
-        [System.Runtime.Interopservices.Marshal]::ReleaseComObject($ppt)
-        '''
-        
-        # Save PowerShell script to temp file
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.ps1', delete=False) as f:
-            f.write(ps_script)
-            ps_file = f.name
-        
-        # Execute PowerShell script
-        cmd = ["powershell.exe", "-ExecutionPolicy", "Bypass", "-File", ps_file]
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=120)
-        
-        # Clean up temp file
-        os.unlink(ps_file)
-        
-        if result.returncode == 0:
-            print("Successfully exported slides using PowerShell")
-            return True
+        root = etree.fromstring(pptx_zip.read(rels_part))
+    except KeyError:
+        return {}
+    return {rel.get('Id'): (rel.get('Type'), rel.get('Target'))
+            for rel in _RELATIONSHIPS(root)}
+
+def _resolve_part(base_part, target):
+    """Resolve a relationship target relative to its source part"""
+    if target.startswith('/'):
+        return target.lstrip('/')
+    return posixpath.normpath(
+        posixpath.join(posixpath.dirname(base_part), target))
+
+def _ordered_slide_parts(pptx_zip):
+    """Slide part names in presentation order via the sldIdLst sequence"""
+    pres_root = etree.fromstring(pptx_zip.read('ppt/presentation.xml'))
+    rels = _part_relationships(pptx_zip, 'ppt/presentation.xml')
+    parts = []
+    for rid in _SLD_IDS(pres_root):
+        target = rels.get(rid, (None, None))[1]
+        if target:
+            parts.append(_resolve_part('ppt/presentation.xml', target))
+    return parts
+
+def extract_slide_content_xml(slide_xml):
+    """Extract text and basic layout from a slide's raw XML part"""
+    content = {
+        'title': '',
+        'bullet_points': [],
+        'other_text': []
+    }
+
+    for shape in _XP_SHAPES(etree.fromstring(slide_xml)):
+        text = '\n'.join(''.join(_XP_RUN_TEXT(p))
+                         for p in _XP_PARAGRAPHS(shape)).strip()
+        if not text:
+            continue
+
+        if _XP_IS_PH(shape):
+            # An omitted type attribute means a body placeholder per the spec
+            ph_types = _XP_PH_TYPE(shape)
+            ph_type = ph_types[0] if ph_types else 'body'
+            if ph_type in ('title', 'ctrTitle'):
+                content['title'] = text
+            elif ph_type == 'body':
+                # Split by lines and treat as bullet points
+                lines = [line.strip() for line in text.split('\n') if line.strip()]
+                content['bullet_points'].extend(lines)
+            else:
+                content['other_text'].append(text)
         else:
-            print(f"PowerShell export failed: {result.stderr}")
-            return False
-            
+            # No placeholder info, make educated guess
+            if not content['title'] and len(text) < 100:
+                content['title'] = text
+            else:
+                content['other_text'].append(text)
+
+    # Drop repeated strings (template boilerplate) while preserving order -
+    # duplicates would just re-wrap and re-draw identical lines
+    content['bullet_points'] = list(dict.fromkeys(content['bullet_points']))
+    content['other_text'] = list(dict.fromkeys(content['other_text']))
+    return content
+
+def extract_slide_content(slide):
+    """Extract text and basic layout from a slide"""
+    content = {
+        'title': '',
+        'bullet_points': [],
+        'other_text': []
+    }
+
+    for shape in slide.shapes:
+        # getattr with a default skips hasattr's try/except-per-attribute
+        # overhead on shapes without a text frame
+        text = getattr(shape, 'text', '').strip()
+        if not text:
+            continue
+
+        # Try to identify title (usually first or short text)
+        try:
+            placeholder = getattr(shape, 'placeholder_format', None)
+            ph_type = placeholder.type if placeholder is not None else None
+        except Exception as e:
+            # If placeholder access fails, treat as other text
+            print(f"Warning: Could not access placeholder format for shape: {e}")
+            ph_type = None
+
+        if ph_type == 1:  # Title placeholder
+            content['title'] = text
+        elif ph_type == 2:  # Content placeholder
+            # Split by lines and treat as bullet points
+            lines = [line.strip() for line in text.split('\n') if line.strip()]
+            content['bullet_points'].extend(lines)
+        elif ph_type is not None:
+            content['other_text'].append(text)
+        else:
+            # No placeholder info, make educated guess
+            if not content['title'] and len(text) < 100:
+                content['title'] = text
+            else:
+                content['other_text'].append(text)
+
+    # Dedupe repeated strings in-order, matching the XML extractor
+    content['bullet_points'] = list(dict.fromkeys(content['bullet_points']))
+    content['other_text'] = list(dict.fromkeys(content['other_text']))
+    return content
+
+def _probe_font(candidates):
+    """Return the first font path truetype accepts, or None for the default"""
+    for path in candidates:
+        try:
+            ImageFont.truetype(path, 12)
+            return path
+        except OSError:
+            continue
+    return None
+
+# Resolved once per process: macOS system font, then a generic fallback,
+# then Pillow's built-in default
+_FONT_PATH = _probe_font(['/System/Library/Fonts/Helvetica.ttc', 'Arial.ttf'])
+
+@lru_cache(maxsize=None)
+def _get_fonts():
+    """Load the title/content/small fonts once per process.
+
+    Each truetype call parses the font file and allocates a FreeType face,
+    so the result is cached; pool workers fill their own cache lazily on
+    first use rather than pickling font objects across processes. The font
+    path itself is probed once at import, so there's no per-call cascade
+    through OSError handlers.
+    """
+    if _FONT_PATH is None:
+        # Use default font as last resort
+        default_font = ImageFont.load_default()
+        return (default_font, default_font, default_font)
+    return (ImageFont.truetype(_FONT_PATH, 48),
+            ImageFont.truetype(_FONT_PATH, 32),
+            ImageFont.truetype(_FONT_PATH, 24))
+
+@lru_cache(maxsize=None)
+def _char_widths(font_role):
+    """Per-character advance table for printable ASCII, built once per font"""
+    font = _get_fonts()[_FONT_ROLES[font_role]]
+    return {c: font.getlength(c) for c in string.printable}
+
+def wrap_text(text, font, max_width, char_widths=None):
+    """Greedy line wrap using one width measurement per word.
+
+    The old wrap re-measured every candidate line with draw.textbbox,
+    paying an O(words^2) number of FreeType shaping calls; measuring each
+    word once with font.getlength and accumulating widths is O(words).
+    With a char_widths table, ASCII words are summed from cached glyph
+    advances without calling into FreeType at all.
+    """
+    space_width = char_widths[' '] if char_widths else font.getlength(' ')
+    lines = []
+    current_words = []
+    current_width = 0.0
+
+    for word in text.split():
+        if char_widths is not None and all(c in char_widths for c in word):
+            word_width = sum(char_widths[c] for c in word)
+        else:
+            word_width = font.getlength(word)
+        if current_words and current_width + space_width + word_width >= max_width:
+            lines.append(' '.join(current_words))
+            current_words = [word]
+            current_width = word_width
+        else:
+            if current_words:
+                current_width += space_width + word_width
+            else:
+                current_width = word_width
+            current_words.append(word)
+
+    if current_words:
+        lines.append(' '.join(current_words))
+    return lines
+
+# Exported PNGs are intermediates consumed straight away by the video
+# assembly, so favor encode speed over size - zlib level 1 cuts encoder
+# CPU ~3-4x versus Pillow's default level 6 (override via SLIDE_PNG_COMPRESS)
+_PNG_COMPRESS_LEVEL = int(os.environ.get('SLIDE_PNG_COMPRESS', '1'))
+
+# Font roles double as stable cache keys - font object identity is
+# per-process, but "content"/"small" name the same _get_fonts() slot
+# everywhere
+_FONT_ROLES = {"title": 0, "content": 1, "small": 2}
+
+@lru_cache(maxsize=4096)
+def wrap_text_cached(text, font_role, max_width):
+    """Memoized wrap - decks repeat boilerplate (footers, section titles),
+    so identical strings reuse the measured layout instead of re-shaping"""
+    font = _get_fonts()[_FONT_ROLES[font_role]]
+    return tuple(wrap_text(text, font, max_width, _char_widths(font_role)))
+
+# Reusable render canvas and its Draw object, allocated lazily once per
+# worker process - resetting with a rectangle fill is far cheaper than a
+# fresh ~2.7 MB Image.new allocation per slide
+_slide_canvas = None
+_slide_draw = None
+
+def create_slide_image(slide_content, slide_num, width=1280, height=720):
+    """Render extracted content onto the worker's reusable canvas.
+
+    Returns the shared canvas; the caller must consume (save) it before
+    the next call in this process.
+    """
+    global _slide_canvas, _slide_draw
+    # Everything drawn is black/gray on white, so render single-channel -
+    # a third of the pixel bandwidth of RGB for every text blit, and the
+    # grayscale PNG is smaller and faster to encode
+    if _slide_canvas is None or _slide_canvas.size != (width, height):
+        _slide_canvas = Image.new('L', (width, height), color=255)
+        _slide_draw = ImageDraw.Draw(_slide_canvas)
+    img = _slide_canvas
+    draw = _slide_draw
+    # Reset to a white background
+    draw.rectangle((0, 0, width, height), fill=255)
+
+    title_font, content_font, small_font = _get_fonts()
+
+    # multiline_text advances lines by the measured "A" bbox height plus
+    # spacing - not the nominal font size - so derive the spacing from that
+    # height to keep the intra-block pitch exactly 45px/35px, matching the
+    # fixed per-line advance used between blocks
+    content_spacing = 45 - draw.textbbox((0, 0), "A", font=content_font)[3]
+    small_spacing = 35 - draw.textbbox((0, 0), "A", font=small_font)[3]
+
+    y_position = 80
+    margin = 60
+
+    # Draw title
+    if slide_content['title']:
+        # Center the title
+        title_bbox = draw.textbbox((0, 0), slide_content['title'], font=title_font)
+        title_width = title_bbox[2] - title_bbox[0]
+        title_x = (width - title_width) // 2
+        draw.text((title_x, y_position), slide_content['title'], fill=0, font=title_font)
+        y_position += 100
+
+    # Draw bullet points
+    for bullet in slide_content['bullet_points']:
+        if y_position > height - 100:  # Leave space at bottom
+            break
+        # Wrap long text
+        lines = wrap_text_cached(bullet, "content", width - 2 * margin)
+
+        # One multiline draw per bullet: a single layout/render pass
+        # instead of a FreeType render + mask composite per line
+        block = "\n".join(f"• {line}" for line in lines)
+        draw.multiline_text((margin, y_position), block, fill=0,
+                            font=content_font, spacing=content_spacing)
+        y_position += len(lines) * 45
+
+    # Draw other text
+    for text in slide_content['other_text']:
+        if y_position > height - 100:
+            break
+        # Simple text wrapping
+        lines = wrap_text_cached(text, "small", width - 2 * margin)
+
+        draw.multiline_text((margin, y_position), "\n".join(lines),
+                            fill=128, font=small_font, spacing=small_spacing)
+        y_position += len(lines) * 35
+
+    # Add slide number
+    slide_text = f"Slide {slide_num}"
+    draw.text((width - 150, height - 40), slide_text, fill=128, font=small_font)
+
+    return img
+
+# Pre-encoded blank white 1280x720 PNG for empty slides, built lazily
+# once per worker process
+_empty_png = None
+
+def _empty_png_bytes():
+    global _empty_png
+    if _empty_png is None:
+        buf = io.BytesIO()
+        Image.new('L', (1280, 720), color=255).save(
+            buf, 'PNG', compress_level=_PNG_COMPRESS_LEVEL, optimize=False)
+        _empty_png = buf.getvalue()
+    return _empty_png
+
+# Reusable PNG encode buffer, allocated lazily once per worker process
+_png_buf = None
+
+def _save_png(img, output_path):
+    """Encode into a reused in-memory buffer and write with one syscall.
+
+    Letting PIL write through Python's buffered file object costs several
+    syscalls plus an extra buffering layer per PNG; encoding to BytesIO and
+    flushing with a single os.write avoids both.
+    """
+    global _png_buf
+    if _png_buf is None:
+        _png_buf = io.BytesIO()
+    buf = _png_buf
+    buf.seek(0)
+    buf.truncate()
+    img.save(buf, 'PNG', compress_level=_PNG_COMPRESS_LEVEL, optimize=False)
+    fd = os.open(output_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, buf.getbuffer())
+    finally:
+        os.close(fd)
+
+def _render_and_save(args):
+    """Render one slide's extracted content to a PNG (process-pool worker)"""
+    i, content, output_dir = args
+    slide_num = i + 1
+    output_path = os.path.join(output_dir, f"slide_{slide_num}.png")
+    print(f"Creating slide image {slide_num}...")
+
+    try:
+        # Divider slides with no text skip layout, render, and PNG encode
+        # entirely - they all get the same pre-encoded white frame
+        if not (content['title'] or content['bullet_points'] or content['other_text']):
+            with open(output_path, 'wb') as f:
+                f.write(_empty_png_bytes())
+            return f"slide_{slide_num}.png"
+
+        img = create_slide_image(content, slide_num)
+        _save_png(img, output_path)
+        return f"slide_{slide_num}.png"
     except Exception as e:
-        print(f"PowerShell export failed: {e}")
-        return False
+        print(f"Warning: Failed to process slide {slide_num}: {e}")
+        # Create a simple error slide
+        try:
+            error_img = Image.new('RGB', (1280, 720), color='white')
+            error_draw = ImageDraw.Draw(error_img)
+            error_draw.text((50, 300), f"Slide {slide_num} - Processing Error", fill='red')
+            _save_png(error_img, output_path)
+            return f"slide_{slide_num}.png"
+        except Exception:
+            print(f"Could not create error slide for slide {slide_num}")
+            return None
 
 def export_slides_python_fallback(pptx_file, output_dir="exported_slides"):
     """Export slides using pure Python approach (macOS compatible)"""
     print("Trying Python-based slide export (macOS compatible)...")
-    
+
     try:
-        from PIL import Image, ImageDraw, ImageFont
-        
-        def extract_slide_content(slide):
-            """Extract text and basic layout from a slide"""
-            content = {
-                'title': '',
-                'bullet_points': [],
-                'other_text': []
-            }
-            
-            for shape in slide.shapes:
-                if hasattr(shape, "text") and shape.text.strip():
-                    text = shape.text.strip()
-                    
-                    # Try to identify title (usually first or short text)
-                    try:
-                        if hasattr(shape, "placeholder_format") and shape.placeholder_format:
-                            if shape.placeholder_format.type == 1:  # Title placeholder
-                                content['title'] = text
-                            elif shape.placeholder_format.type == 2:  # Content placeholder
-                                # Split by lines and treat as bullet points
-                                lines = [line.strip() for line in text.split('\n') if line.strip()]
-                                content['bullet_points'].extend(lines)
-                            else:
-                                content['other_text'].append(text)
-                        else:
-                            # No placeholder info, make educated guess
-                            if not content['title'] and len(text) < 100:
-                                content['title'] = text
-                            else:
-                                content['other_text'].append(text)
-                    except Exception as e:
-                        # If placeholder access fails, treat as other text
-                        print(f"Warning: Could not access placeholder format for shape: {e}")
-                        if not content['title'] and len(text) < 100:
-                            content['title'] = text
-                        else:
-                            content['other_text'].append(text)
-            
-            return content
+        # Create output directory
+        os.makedirs(output_dir, exist_ok=True)
 
-        def create_slide_image(slide_content, slide_num, width=1280, height=720):
-            """Create a simple slide image from extracted content"""
-            # Create a white background
-            img = Image.new('RGB', (width, height), color='white')
-            draw = ImageDraw.Draw(img)
-            
-            # Try to load system fonts, fallback to default
-            try:
-                # macOS system fonts
-                title_font = ImageFont.truetype('/System/Library/Fonts/Helvetica.ttc', 48)
-                content_font = ImageFont.truetype('/System/Library/Fonts/Helvetica.ttc', 32)
-                small_font = ImageFont.truetype('/System/Library/Fonts/Helvetica.ttc', 24)
-            except:
+        # Extract content in the parent, then render and PNG-encode in
+        # worker processes - the zlib compression dominates and scales
+        # with core count. Extraction reads the slide XML parts straight
+        # out of the pptx zip; python-pptx is kept only as a fallback.
+        contents = None
+        try:
+            with zipfile.ZipFile(pptx_file) as pptx_zip:
                 try:
-                    # Fallback fonts
-                    title_font = ImageFont.truetype('Arial.ttf', 48)
-                    content_font = ImageFont.truetype('Arial.ttf', 32)
-                    small_font = ImageFont.truetype('Arial.ttf', 24)
-                except:
-                    # Use default font as last resort
-                    title_font = ImageFont.load_default()
-                    content_font = ImageFont.load_default()
-                    small_font = ImageFont.load_default()
-            
-            y_position = 80
-            margin = 60
-            
-            # Draw title
-            if slide_content['title']:
-                # Center the title
-                title_bbox = draw.textbbox((0, 0), slide_content['title'], font=title_font)
-                title_width = title_bbox[2] - title_bbox[0]
-                title_x = (width - title_width) // 2
-                draw.text((title_x, y_position), slide_content['title'], fill='black', font=title_font)
-                y_position += 100
-            
-            # Draw bullet points
-            for bullet in slide_content['bullet_points']:
-                if y_position > height - 100:  # Leave space at bottom
-                    break
-                # Wrap long text
-                words = bullet.split()
-                lines = []
-                current_line = []
-                
-                for word in words:
-                    test_line = ' '.join(current_line + [word])
-                    bbox = draw.textbbox((0, 0), test_line, font=content_font)
-                    if bbox[2] - bbox[0] < width - 2 * margin:
-                        current_line.append(word)
-                    else:
-                        if current_line:
-                            lines.append(' '.join(current_line))
-                        current_line = [word]
-                
-                if current_line:
-                    lines.append(' '.join(current_line))
-                
-                for line in lines:
-                    draw.text((margin, y_position), f"• {line}", fill='black', font=content_font)
-                    y_position += 45
-            
-            # Draw other text
-            for text in slide_content['other_text']:
-                if y_position > height - 100:
-                    break
-                # Simple text wrapping
-                words = text.split()
-                lines = []
-                current_line = []
-                
-                for word in words:
-                    test_line = ' '.join(current_line + [word])
-                    bbox = draw.textbbox((0, 0), test_line, font=small_font)
-                    if bbox[2] - bbox[0] < width - 2 * margin:
-                        current_line.append(word)
-                    else:
-                        if current_line:
-                            lines.append(' '.join(current_line))
-                        current_line = [word]
-                
-                if current_line:
-                    lines.append(' '.join(current_line))
-                
-                for line in lines:
-                    draw.text((margin, y_position), line, fill='gray', font=small_font)
-                    y_position += 35
-            
-            # Add slide number
-            slide_text = f"Slide {slide_num}"
-            draw.text((width - 150, height - 40), slide_text, fill='gray', font=small_font)
-            
-            return img
+                    # Presentation order, not part-number order - the two
+                    # diverge on decks whose slides were reordered
+                    slide_parts = _ordered_slide_parts(pptx_zip)
+                except Exception as e:
+                    print(f"Warning: could not resolve slide order ({e}), using part numbering")
+                    slide_parts = sorted(
+                        (name for name in pptx_zip.namelist() if _SLIDE_PART_RE.match(name)),
+                        key=lambda name: int(_SLIDE_PART_RE.match(name).group(1)))
+                # ZipFile.read isn't safe to share across threads, so pull
+                # the raw parts first, then parse concurrently - lxml
+                # releases the GIL inside fromstring, so the parses overlap
+                slide_blobs = [pptx_zip.read(name) for name in slide_parts]
+            with ThreadPoolExecutor(max_workers=8) as parser_pool:
+                contents = list(parser_pool.map(extract_slide_content_xml, slide_blobs))
+            print(f"Loaded {len(contents)} slides for Python export (direct XML scan)")
+        except Exception as e:
+            print(f"Direct XML extraction failed ({e}), falling back to python-pptx")
 
-        # Load presentation
-        presentation = Presentation(pptx_file)
-        print(f"Loaded presentation with {len(presentation.slides)} slides for Python export")
-        
-        # Create output directory
-        os.makedirs(output_dir, exist_ok=True)
-        
-        # Process each slide
-        for i, slide in enumerate(presentation.slides):
-            slide_num = i + 1
-            print(f"Creating slide image {slide_num}...")
-            
-            try:
-                # Extract content
-                content = extract_slide_content(slide)
-                
-                # Create image
-                img = create_slide_image(content, slide_num)
-                
-                # Save image
-                output_path = os.path.join(output_dir, f"slide_{slide_num}.png")
-                img.save(output_path)
-            except Exception as e:
-                print(f"Warning: Failed to process slide {slide_num}: {e}")
-                # Create a simple error slide
+        if contents is None:
+            from pptx import Presentation
+            presentation = Presentation(pptx_file)
+            print(f"Loaded presentation with {len(presentation.slides)} slides for Python export")
+            contents = []
+            for i, slide in enumerate(presentation.slides):
                 try:
-                    error_img = Image.new('RGB', (1280, 720), color='white')
-                    error_draw = ImageDraw.Draw(error_img)
-                    error_draw.text((50, 300), f"Slide {slide_num} - Processing Error", fill='red')
-                    output_path = os.path.join(output_dir, f"slide_{slide_num}.png")
-                    error_img.save(output_path)
-                except:
-                    print(f"Could not create error slide for slide {slide_num}")
-                    continue
-        
-        print(f"Successfully exported {len(presentation.slides)} slides to {output_dir}/")
-        return True
-        
+                    contents.append(extract_slide_content(slide))
+                except Exception as e:
+                    print(f"Warning: Could not extract content from slide {i+1}: {e}")
+                    contents.append({'title': '', 'bullet_points': [], 'other_text': []})
+
+        tasks = [(i, content, output_dir) for i, content in enumerate(contents)]
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            # chunksize amortizes pickling overhead across several slides
+            results = list(executor.map(_render_and_save, tasks, chunksize=4))
+
+        created_files = [name for name in results if name]
+        print(f"Successfully exported {len(created_files)} slides to {output_dir}/")
+        return created_files
+
     except Exception as e:
         print(f"Python-based export failed: {e}")
         return False
@@ -423,39 +827,36 @@ def find_exported_slides():
     possible_dirs = ["uploaded_slides", "exported_slides", "manual_slides", "slide_exports", "slides"]
     
     for dir_name in possible_dirs:
-        if os.path.exists(dir_name):
-            # Accept both slide_1.png and Slide1.png patterns
-            png_files = [f for f in os.listdir(dir_name) if f.lower().endswith('.png') and (f.lower().startswith('slide_') or f.lower().startswith('slide'))]
-            if png_files:
-                # Sort numerically instead of alphabetically
-                import re
-                def natural_sort_key(filename):
-                    # Extract numbers from filename for proper sorting
-                    numbers = re.findall(r'\d+', filename)
-                    if numbers:
-                        return int(numbers[0])  # Sort by first number found
-                    return 0
-                png_files.sort(key=natural_sort_key)
-                return dir_name, png_files
-    
+        try:
+            # scandir caches the file type on the DirEntry, so this is one
+            # syscall per directory instead of exists + listdir + stats
+            with os.scandir(dir_name) as it:
+                png_files = [e.name for e in it
+                             if e.is_file() and e.name.lower().endswith('.png')
+                             and e.name.lower().startswith('slide')]
+        except OSError:
+            continue
+        if png_files:
+            # Sort numerically instead of alphabetically (first number found)
+            png_files.sort(key=lambda f: int(m.group()) if (m := _NUM_RE.search(f)) else 0)
+            return dir_name, png_files
+
     return None, []
 
-def extract_narration_from_slides(presentation):
-    """Extract narration text from PowerPoint slide notes"""
-    narration_dict = {}
-    
-    for i, slide in enumerate(presentation.slides):
+def extract_narration_from_slides(slides):
+    """Extract narration text from a pre-materialized list of slides"""
+    # Accumulate (key, text) pairs and build the dict in one shot at the
+    # end, avoiding incremental resizes of the dict's hash table on large decks
+    narration_items = []
+
+    for i, slide in enumerate(slides):
         try:
-            # Get slide title if available
-            title = ""
-            for shape in slide.shapes:
-                if hasattr(shape, "text") and shape.text.strip():
-                    if hasattr(shape, "placeholder_format") and shape.placeholder_format.type == 1:  # Title placeholder
-                        title = shape.text.strip()
-                        break
-                    elif not title and len(shape.text.strip()) < 100:  # Fallback: short text might be title
-                        title = shape.text.strip()
-            
+            # Get slide title if available - shapes.title resolves the title
+            # placeholder directly instead of scanning every shape, where
+            # each hasattr/placeholder_format access re-walks the slide XML
+            title_shape = slide.shapes.title
+            title = title_shape.text.strip() if title_shape and title_shape.has_text_frame else ""
+
             # Get slide notes
             if slide.has_notes_slide:
                 notes_slide = slide.notes_slide
@@ -465,32 +866,131 @@ def extract_narration_from_slides(presentation):
                         # Store by title and by slide number as fallback
                         if title:
                             print(f"Slide {i+1} ('{title}'): {len(narration_text)} characters of narration")
-                            narration_dict[title] = narration_text
-                        
+                            narration_items.append((title, narration_text))
+
                         # Also store by slide number for backup lookup
-                        slide_key = f"slide_{i+1}"
-                        narration_dict[slide_key] = narration_text
-                        
+                        narration_items.append((f"slide_{i+1}", narration_text))
+
                         if not title:
                             print(f"Slide {i+1} (no title): {len(narration_text)} characters of narration")
-        
+
         except Exception as e:
             print(f"Warning: Could not extract narration from slide {i+1}: {e}")
             continue
-    
-    return narration_dict
+
+    return dict(narration_items)
+
+# Reusable letterbox canvas, allocated lazily once per worker process
+_worker_canvas = None
+
+def process_slide(i, slides_dir, slide_file):
+    """
+    Resize and letterbox one exported slide to a raw 1280x720 RGB frame
+
+    Runs in a worker process, so it must stay self-contained (module-level
+    function, only picklable arguments). Returns raw pixel bytes rather
+    than writing a PNG, so the frame can be piped straight into ffmpeg
+    without an encode/decode round-trip through disk.
+
+    Args:
+        i (int): Zero-based slide index
+        slides_dir (str): Directory containing the exported slide images
+        slide_file (str): Filename of the slide image to process
+
+    Returns:
+        bytes or None: Raw RGB24 frame data, or None on failure
+    """
+    slide_path = os.path.join(slides_dir, slide_file)
+    print(f"--- Processing slide {i+1}: {slide_file} ---")
+
+    try:
+        # Check the content-hash cache - if this exact slide image was
+        # already processed (on any run), reuse the letterboxed frame
+        with open(slide_path, 'rb') as f:
+            source_bytes = f.read()
+        frame_key = cache.content_key("frame-1280x720", source_bytes)
+        cached_frame = cache.cache_path(frame_key, ".rgb")
+        if cached_frame.exists():
+            print(f"Slide {i+1} unchanged, reusing cached frame")
+            return cached_frame.read_bytes()
+
+        # Load the slide image; draft lets JPEG-like decoders downscale
+        # during decode (it's a no-op for PNG)
+        slide_img = Image.open(io.BytesIO(source_bytes))
+        slide_img.draft("RGB", (1280, 720))
+
+        # Exporters now emit slides at the target size, so most frames can
+        # skip the resize/letterbox work entirely
+        if slide_img.size == (1280, 720) and slide_img.mode == "RGB":
+            frame = slide_img.tobytes()
+            cached_frame.write_bytes(frame)
+            cache.record_entry(frame_key, f"frame: {slide_file}")
+            return frame
+
+        # Convert to RGB before resizing so the paste below stays off the
+        # palette/alpha conversion path
+        if slide_img.mode != "RGB":
+            slide_img = slide_img.convert("RGB")
+
+        # High-resolution exports (e.g. 300dpi) are much larger than the video
+        # frame, so do a cheap integer box reduce first - it is far faster
+        # than LANCZOS and visually identical for a big downscale
+        factor = max(1, min(slide_img.width // 1280, slide_img.height // 720))
+        if factor > 1:
+            slide_img = slide_img.reduce(factor)
+
+        # Resize if needed to standard video dimensions
+        # Keep aspect ratio but fit within 1280x720
+        # After the integer reduce the remaining scale is mild (>= 0.5), and
+        # for mild downscales BILINEAR is visually equivalent to LANCZOS at a
+        # fraction of the cost - only heavy downscales need the wider kernel
+        scale = min(1280 / slide_img.width, 720 / slide_img.height)
+        resample = (Image.Resampling.LANCZOS if scale < 0.5
+                    else Image.Resampling.BILINEAR)
+        slide_img.thumbnail((1280, 720), resample, reducing_gap=3.0)
+
+        # Letterbox onto a canvas reused across slides within this worker
+        # process - resetting to white is a block fill, much cheaper than
+        # allocating a fresh 1280x720x3 image per slide
+        global _worker_canvas
+        if _worker_canvas is None:
+            _worker_canvas = Image.new("RGB", (1280, 720), color="white")
+        canvas = _worker_canvas
+        canvas.paste("white", (0, 0, 1280, 720))
+        x_offset = (1280 - slide_img.width) // 2
+        y_offset = (720 - slide_img.height) // 2
+        canvas.paste(slide_img, (x_offset, y_offset))
+
+        frame = canvas.tobytes()
+
+        # Store the frame so reruns with an unchanged slide skip the resize
+        cached_frame.write_bytes(frame)
+        cache.record_entry(frame_key, f"frame: {slide_file}")
+        return frame
+
+    except Exception as e:
+        print(f"Error processing slide {i+1}: {e}")
+        return None
 
 # Load the PowerPoint presentation to get slide count and titles
 def main():
     """Main function to export slides from PowerPoint"""
+    # python-pptx is imported here rather than at module level so that
+    # importing this module for its helpers (find_exported_slides, the
+    # export_slides_* functions) doesn't pay python-pptx's startup cost
+    from pptx import Presentation
+
     pptx_file = os.environ.get('POWERPOINT_FILE', 'content_maintenance_process.pptx')
     print(f"Loading PowerPoint presentation: {pptx_file}")
     presentation = Presentation(pptx_file)
-    print(f"Loaded presentation with {len(presentation.slides)} slides")
+    # Materialize the slides collection once - len() and the narration walk
+    # would each trigger python-pptx's lazy slide enumeration otherwise
+    slides = list(presentation.slides)
+    print(f"Loaded presentation with {len(slides)} slides")
 
     # Extract narration from PowerPoint slide notes
     print(f"\nExtracting narration from PowerPoint slide notes...")
-    narration_notes = extract_narration_from_slides(presentation)
+    narration_notes = extract_narration_from_slides(slides)
 
     if not narration_notes:
         print("Warning: No narration found in slide notes. Videos will be silent.")
@@ -502,46 +1002,92 @@ def main():
 
     # If uploaded_slides exists and contains PNGs, use those and skip export/cleanup
     uploaded_dir = "uploaded_slides"
-    uploaded_pngs = [f for f in os.listdir(uploaded_dir) if f.lower().endswith('.png')] if os.path.exists(uploaded_dir) else []
+    try:
+        with os.scandir(uploaded_dir) as it:
+            uploaded_pngs = [e.name for e in it if e.name.lower().endswith('.png')]
+    except OSError:
+        uploaded_pngs = []
     if uploaded_pngs:
+        # scandir returns filesystem order - natural-sort by slide number
+        # like every other discovery path
+        uploaded_pngs.sort(key=lambda f: int(m.group()) if (m := _NUM_RE.search(f)) else 0)
         print(f"Found {len(uploaded_pngs)} PNG slides in {uploaded_dir}/. Using these and skipping export.")
         slides_dir, slide_files = uploaded_dir, uploaded_pngs
     else:
-        # Always clean up exported_slides before generating new ones
+        # Always clean up exported_slides before generating new ones -
+        # scandir hands back full paths on the DirEntry, so there's no
+        # join + extra stat per file
         export_dir = "exported_slides"
-        if os.path.exists(export_dir):
-            old_files = [f for f in os.listdir(export_dir) if f.lower().endswith('.png')]
-            if old_files:
-                print(f"Cleaning up {len(old_files)} old slide images from {export_dir}/.")
-                for f in old_files:
-                    os.remove(os.path.join(export_dir, f))
-
-        success = False
-
-        # Try macOS Keynote method first (best visual fidelity on macOS)
-        print("Trying macOS Keynote export...")
-        success = export_slides_as_images_macos_keynote(pptx_file)
-
-        # Try PowerShell method (best for Windows)
-        if not success:
-            print("Trying PowerShell export...")
-            success = export_slides_as_images_powershell(pptx_file)
-
-        # If PowerShell failed, try LibreOffice
-        if not success:
+        try:
+            with os.scandir(export_dir) as it:
+                old_entries = [e for e in it if e.name.lower().endswith('.png')]
+        except OSError:
+            old_entries = []
+        if old_entries:
+            print(f"Cleaning up {len(old_entries)} old slide images from {export_dir}/.")
+            for entry in old_entries:
+                os.remove(entry.path)
+
+        # Exported slides are cached by a content hash of the deck - when
+        # the pptx is byte-identical to a previous run, restoring the PNGs
+        # is a file copy instead of tens of seconds of LibreOffice/COM work
+        with open(pptx_file, 'rb') as f:
+            deck_key = cache.content_key("exported-slides", f.read())
+        deck_cache_dir = cache.CACHE_DIR / f"{deck_key}.slides"
+
+        exported = None
+        if deck_cache_dir.is_dir():
+            cached_slides = sorted(
+                (entry.name for entry in os.scandir(deck_cache_dir)
+                 if entry.name.lower().endswith('.png')),
+                key=lambda f: int(m.group()) if (m := _NUM_RE.search(f)) else 0)
+            if cached_slides:
+                print(f"Deck unchanged - restoring {len(cached_slides)} cached slide images")
+                os.makedirs(export_dir, exist_ok=True)
+                for name in cached_slides:
+                    shutil.copyfile(deck_cache_dir / name, os.path.join(export_dir, name))
+                exported = cached_slides
+
+        # Each exporter returns the sorted list of slide filenames it wrote,
+        # so on success we skip re-walking the candidate directories
+
+        # Try LibreOffice + pdftoppm first - one process launch for the whole
+        # deck, much faster than per-slide PowerPoint COM calls
+        if not exported:
             print("Trying LibreOffice export...")
-            success = export_slides_as_images_libreoffice(pptx_file)
+            exported = export_slides_as_images_libreoffice(pptx_file)
 
-        # If both failed, try Python-based approach (macOS compatible)
-        if not success:
-            print("Trying Python-based export (macOS compatible)...")
-            success = export_slides_python_fallback(pptx_file)
+            # Try macOS Keynote method (best visual fidelity on macOS)
+            if not exported:
+                print("Trying macOS Keynote export...")
+                exported = export_slides_as_images_macos_keynote(pptx_file)
 
-        # Look for existing exported slides
-        slides_dir, slide_files = find_exported_slides()
+            # Try PowerShell method (Windows fallback)
+            if not exported:
+                print("Trying PowerShell export...")
+                exported = export_slides_as_images_powershell(pptx_file)
 
-    # Look for existing exported slides
-    slides_dir, slide_files = find_exported_slides()
+            # If both failed, try Python-based approach (macOS compatible)
+            if not exported:
+                print("Trying Python-based export (macOS compatible)...")
+                exported = export_slides_python_fallback(pptx_file)
+
+            # Populate the cache so the next run on this deck skips export
+            if exported:
+                try:
+                    deck_cache_dir.mkdir(parents=True, exist_ok=True)
+                    for name in exported:
+                        shutil.copyfile(os.path.join(export_dir, name), deck_cache_dir / name)
+                    cache.record_entry(deck_key, f"exported slides: {pptx_file}")
+                except OSError as e:
+                    print(f"Warning: could not cache exported slides: {e}")
+
+        if exported:
+            slides_dir, slide_files = "exported_slides", exported
+        else:
+            # All exporters failed - fall back to scanning for slides the
+            # user may have exported manually
+            slides_dir, slide_files = find_exported_slides()
 
     if not slides_dir:
         print("Could not automatically export slides.")
@@ -556,64 +1102,87 @@ def main():
         print(f"  ... and {len(slide_files)-5} more")
 
     # Create video from exported slides
-    video_clips = []
+    slide_duration = 4  # 4 seconds per slide
     print("\nCreating video from slide images...")
 
-    for i, slide_file in enumerate(slide_files):
-        slide_path = os.path.join(slides_dir, slide_file)
-        print(f"\n--- Processing slide {i+1}/{len(slide_files)}: {slide_file} ---")
-        
-        try:
-            # Load the slide image
-            slide_img = Image.open(slide_path)
-            print(f"Loaded slide image: {slide_img.size}")
-            
-            # Resize if needed to standard video dimensions
-            # Keep aspect ratio but fit within 1280x720
-            slide_img.thumbnail((1280, 720), Image.Resampling.LANCZOS)
-            
-            # Create a 1280x720 canvas and center the slide
-            canvas = Image.new("RGB", (1280, 720), color="white")
-            x_offset = (1280 - slide_img.width) // 2
-            y_offset = (720 - slide_img.height) // 2
-            canvas.paste(slide_img, (x_offset, y_offset))
-            
-            # Save the processed slide
-            processed_path = f"slide_images/processed_slide_{i+1}.png"
-            os.makedirs("slide_images", exist_ok=True)
-            canvas.save(processed_path)
-            
-            # Create video clip
-            duration = 4  # 4 seconds per slide
-            image_clip = ImageClip(processed_path).with_duration(duration)
-            video_clips.append(image_clip)
-            print(f"Created video clip {i+1} with duration {duration}s")
-            
-        except Exception as e:
-            print(f"Error processing slide {i+1}: {e}")
+    # Resize/letterbox all slides in parallel - LANCZOS resampling is
+    # CPU-bound and each slide is independent, so this scales with cores
+    print(f"Processing {len(slide_files)} slides across CPU cores...")
+    with ProcessPoolExecutor() as executor:
+        results = list(executor.map(process_slide,
+                                    range(len(slide_files)),
+                                    [slides_dir] * len(slide_files),
+                                    slide_files))
+    processed_frames = [frame for frame in results if frame]
 
-    # Combine clips into final video
-    if video_clips:
-        print(f"\nCombining {len(video_clips)} video clips into final video...")
-        final_video = concatenate_videoclips(video_clips, method="compose")
-        print("Video clips concatenated successfully")
+    # Pipe the raw frames straight into ffmpeg: one RGB24 frame per slide at
+    # 1/slide_duration fps input, duplicated to 24fps on output. This skips
+    # N PNG encodes + N PNG decodes + the disk round-trip entirely.
+    if processed_frames:
+        print(f"\nCombining {len(processed_frames)} slides into final video...")
 
-        # Generate output filename based on PowerPoint file (for intermediate slides-only video)
-        pptx_file = get_powerpoint_file()
+        # Generate output filename based on PowerPoint file (for intermediate
+        # slides-only video) - pptx_file was already resolved at entry, no
+        # need to consult the environment again
         output_filename = generate_output_filename(pptx_file, "_SLIDES")
+
         print(f"Writing final video file: {output_filename}")
-        final_video.write_videofile(output_filename, fps=24)
+
+        def run_encode(codec_args):
+            """Pipe the raw frames through ffmpeg with the given codec flags
+
+            Returns (returncode, stderr_text), or None if ffmpeg could not run.
+            """
+            # Without -t the output ends at the last input timestamp, which
+            # would cut the final slide to a single output frame
+            total_duration = len(processed_frames) * slide_duration
+            cmd = [
+                "ffmpeg", "-y",
+                "-f", "rawvideo", "-pix_fmt", "rgb24", "-s", "1280x720",
+                "-framerate", str(1.0 / slide_duration), "-i", "-",
+                *codec_args,
+                "-pix_fmt", "yuv420p", "-r", "24",
+                "-t", str(total_duration),
+                output_filename
+            ]
+            try:
+                process = subprocess.Popen(cmd, stdin=subprocess.PIPE,
+                                           stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+                # communicate drains stderr while feeding stdin, so a chatty
+                # ffmpeg run can't fill the pipe buffer and deadlock; it also
+                # swallows the broken pipe when ffmpeg rejects the encoder
+                # up front, leaving the failure in the returncode instead
+                _, stderr = process.communicate(input=b"".join(processed_frames),
+                                                timeout=600)
+                return process.returncode, stderr.decode(errors='replace')
+            except BrokenPipeError:
+                # ffmpeg exited before reading any input (e.g. unknown
+                # encoder) - let the caller fall back quietly
+                return None
+            except Exception as e:
+                print(f"ffmpeg encoding failed: {e}")
+                return None
+
+        # Try the GPU encoder first - NVENC offloads encoding to dedicated
+        # silicon - and fall back to libx264 with still-image tuning. For
+        # static slides motion estimation is wasted work, so ultrafast costs
+        # no visible quality here.
+        result = run_encode(["-c:v", "h264_nvenc", "-preset", "p1"])
+        if result is None or result[0] != 0:
+            print("NVENC unavailable, encoding with libx264...")
+            result = run_encode(["-c:v", "libx264", "-preset", "ultrafast", "-tune", "stillimage"])
+
+        if result is None:
+            return None
+        returncode, stderr_text = result
+        if returncode != 0:
+            print(f"ffmpeg encoding failed: {stderr_text}")
+            return None
         print("Final video file written successfully!")
 
-        # Cleanup
-        print("Starting cleanup...")
-        for clip in video_clips:
-            clip.close()
-        final_video.close()
-        
         print(f"\nVideo created successfully: {output_filename}")
-        print(f"Duration: {len(video_clips) * 4} seconds ({len(video_clips)} slides x 4 seconds each)")
-        
+        print(f"Duration: {len(processed_frames) * slide_duration} seconds ({len(processed_frames)} slides x {slide_duration} seconds each)")
+
         # Return the filename so it can be cleaned up later if needed
         return output_filename
     else:
@@ -1,71 +1,193 @@
+import json
 import os
+import posixpath
 import re
+import shutil
 import subprocess
-import numpy as np
-from pptx import Presentation
-from moviepy import ImageClip, AudioFileClip, concatenate_videoclips
-from PIL import Image
+import wave
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from lxml import etree
+from PIL import Image, ImageOps
 import tempfile
 from dotenv import load_dotenv
 
 # Import generate_audio_file with fallback for relative import
 try:
-    from .generate_audio import generate_audio_file
+    from .generate_audio import generate_audio_file, generate_audio_files_batch, AUDIO_EXT
     from .filename_utils import get_powerpoint_file, get_output_video_name
 except ImportError:
-    from generate_audio import generate_audio_file
+    from generate_audio import generate_audio_file, generate_audio_files_batch, AUDIO_EXT
     from filename_utils import get_powerpoint_file, get_output_video_name
 
 # Load environment variables
 load_dotenv()
 
+# Compiled once at import time - the natural sort key runs for every file
+# in every candidate slide directory
+_NUM_RE = re.compile(r'\d+')
+
 # Configuration from environment variables
 pptx_file = get_powerpoint_file()
 output_video_name = get_output_video_name()
 pause_duration = float(os.environ.get('PAUSE_DURATION', '1.5'))
 include_end_slide = os.environ.get('INCLUDE_END_SLIDE', 'true').lower() in ('true', 'yes', '1')
 
-def extract_narration_from_slides(presentation):
-    """Extract narration text from PowerPoint slide notes"""
+# Sidecar cache for extracted narration - skips the python-pptx zip+XML
+# parse when the presentation file hasn't changed between runs
+NARRATION_CACHE_PATH = "narration_cache.json"
+
+def load_narration_cache(pptx_path):
+    """Load cached narration notes if the pptx is unchanged, else None"""
+    try:
+        with open(NARRATION_CACHE_PATH) as f:
+            cached = json.load(f)
+        if (cached.get("file") == pptx_path
+                and cached.get("mtime_ns") == os.stat(pptx_path).st_mtime_ns):
+            return cached["notes"]
+    except (OSError, ValueError, KeyError):
+        pass
+    return None
+
+def save_narration_cache(pptx_path, notes):
+    """Store extracted narration notes alongside the pptx mtime"""
+    try:
+        with open(NARRATION_CACHE_PATH, "w") as f:
+            json.dump({"file": pptx_path,
+                       "mtime_ns": os.stat(pptx_path).st_mtime_ns,
+                       "notes": notes}, f)
+    except OSError as e:
+        print(f"Warning: could not write narration cache: {e}")
+
+# Precompiled XPaths for narration extraction - a pptx is a zip of XML
+# parts, and we only need the title and notes text per slide, so reading
+# the two relevant parts directly is far cheaper than having python-pptx
+# build an object for every shape in the deck
+_PPTX_NS = {
+    'a': 'http://schemas.openxmlformats.org/drawingml/2006/main',
+    'p': 'http://schemas.openxmlformats.org/presentationml/2006/main',
+}
+_TITLE_SHAPES = etree.XPath(
+    ".//p:sp[p:nvSpPr/p:nvPr/p:ph[@type='title' or @type='ctrTitle']]",
+    namespaces=_PPTX_NS)
+_NOTES_BODY_SHAPES = etree.XPath(
+    ".//p:sp[p:nvSpPr/p:nvPr/p:ph[@type='body']]",
+    namespaces=_PPTX_NS)
+_SHAPE_PARAGRAPHS = etree.XPath("p:txBody/a:p", namespaces=_PPTX_NS)
+_PARAGRAPH_TEXT = etree.XPath(".//a:t/text()", namespaces=_PPTX_NS)
+_SLIDE_PART_RE = re.compile(r'ppt/slides/slide(\d+)\.xml$')
+
+# Part numbering (slide1.xml, slide2.xml, ...) does not track presentation
+# order once slides have been reordered or inserted, so the true order comes
+# from presentation.xml's sldIdLst joined against the relationship targets
+_R_NS = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships'
+_REL_NS = {'rel': 'http://schemas.openxmlformats.org/package/2006/relationships'}
+_SLD_IDS = etree.XPath('p:sldIdLst/p:sldId/@r:id',
+                       namespaces={**_PPTX_NS, 'r': _R_NS})
+_RELATIONSHIPS = etree.XPath('rel:Relationship', namespaces=_REL_NS)
+
+def _part_relationships(pptx_zip, part_name):
+    """Map relationship ids to (type, target) for one part's .rels XML"""
+    rels_part = posixpath.join(posixpath.dirname(part_name), '_rels',
+                               posixpath.basename(part_name) + '.rels')
+    try:
+        root = etree.fromstring(pptx_zip.read(rels_part))
+    except KeyError:
+        return {}
+    return {rel.get('Id'): (rel.get('Type'), rel.get('Target'))
+            for rel in _RELATIONSHIPS(root)}
+
+def _resolve_part(base_part, target):
+    """Resolve a relationship target relative to its source part"""
+    if target.startswith('/'):
+        return target.lstrip('/')
+    return posixpath.normpath(
+        posixpath.join(posixpath.dirname(base_part), target))
+
+def _ordered_slide_parts(pptx_zip):
+    """Slide part names in presentation order via the sldIdLst sequence"""
+    pres_root = etree.fromstring(pptx_zip.read('ppt/presentation.xml'))
+    rels = _part_relationships(pptx_zip, 'ppt/presentation.xml')
+    parts = []
+    for rid in _SLD_IDS(pres_root):
+        target = rels.get(rid, (None, None))[1]
+        if target:
+            parts.append(_resolve_part('ppt/presentation.xml', target))
+    return parts
+
+def _notes_part_for(pptx_zip, slide_part):
+    """Find a slide's notes part through its own relationships, if any"""
+    for rel_type, target in _part_relationships(pptx_zip, slide_part).values():
+        if rel_type and rel_type.endswith('/notesSlide'):
+            return _resolve_part(slide_part, target)
+    return None
+
+def _shape_text(shape):
+    """Join a shape's text runs, preserving paragraph breaks"""
+    return "\n".join("".join(_PARAGRAPH_TEXT(p))
+                     for p in _SHAPE_PARAGRAPHS(shape))
+
+def extract_narration_from_slides(pptx_path):
+    """Extract narration text from PowerPoint slide notes.
+
+    Reads the slide and notes XML parts straight out of the pptx zip with
+    lxml rather than loading the whole deck through python-pptx.
+    """
     narration_dict = {}
-    
-    for i, slide in enumerate(presentation.slides):
+
+    with zipfile.ZipFile(pptx_path) as pptx_zip:
+        part_names = set(pptx_zip.namelist())
         try:
-            # Get slide title if available
-            title = ""
-            if hasattr(slide, 'shapes') and slide.shapes.title:
-                title = slide.shapes.title.text.strip()
-            
-            # Get narration from slide notes
-            narration = ""
+            slide_parts = _ordered_slide_parts(pptx_zip)
+        except Exception as e:
+            # Degraded fallback: part-number order matches presentation
+            # order for decks that were never reordered
+            print(f"Warning: could not resolve slide order ({e}), using part numbering")
+            slide_parts = sorted(
+                (name for name in part_names if _SLIDE_PART_RE.match(name)),
+                key=lambda name: int(_SLIDE_PART_RE.match(name).group(1)))
+
+        for i, slide_part in enumerate(slide_parts):
             try:
-                notes_slide = slide.notes_slide
-                if notes_slide and hasattr(notes_slide, 'notes_text_frame'):
-                    notes_text_frame = notes_slide.notes_text_frame
-                    if notes_text_frame and hasattr(notes_text_frame, 'text'):
-                        narration = notes_text_frame.text.strip()
-            except Exception as e:
-                print(f"Warning: Could not read notes for slide {i+1}: {e}")
-            
-            # Store narration by slide number (primary) and by title (secondary for compatibility)
-            if narration:
-                # Always store by slide number for guaranteed uniqueness
-                narration_dict[f"slide_{i+1}"] = narration
-                
-                # Also store by title if available (but slide number takes precedence)
-                if title:
-                    # Only store by title if it doesn't already exist (avoids overwriting duplicates)
-                    if title not in narration_dict:
-                        narration_dict[title] = narration
-                    print(f"Slide {i+1} ('{title}'): {len(narration)} characters of narration")
+                # Get slide title if available
+                title = ""
+                slide_root = etree.fromstring(pptx_zip.read(slide_part))
+                title_shapes = _TITLE_SHAPES(slide_root)
+                if title_shapes:
+                    title = _shape_text(title_shapes[0]).strip()
+
+                # Get narration from the notes slide's body placeholder,
+                # located through the slide part's own relationships
+                narration = ""
+                notes_part = _notes_part_for(pptx_zip, slide_part)
+                if notes_part and notes_part in part_names:
+                    try:
+                        notes_root = etree.fromstring(pptx_zip.read(notes_part))
+                        narration = "\n".join(
+                            _shape_text(shape)
+                            for shape in _NOTES_BODY_SHAPES(notes_root)).strip()
+                    except etree.XMLSyntaxError as e:
+                        print(f"Warning: Could not read notes for slide {i+1}: {e}")
+
+                # Store narration by slide number (primary) and by title (secondary for compatibility)
+                if narration:
+                    # Always store by slide number for guaranteed uniqueness
+                    narration_dict[f"slide_{i+1}"] = narration
+
+                    # Also store by title if available (but slide number takes precedence)
+                    if title:
+                        # Only store by title if it doesn't already exist (avoids overwriting duplicates)
+                        if title not in narration_dict:
+                            narration_dict[title] = narration
+                        print(f"Slide {i+1} ('{title}'): {len(narration)} characters of narration")
+                    else:
+                        print(f"Slide {i+1} (no title): {len(narration)} characters of narration")
                 else:
-                    print(f"Slide {i+1} (no title): {len(narration)} characters of narration")
-            else:
-                print(f"Slide {i+1}: No narration found")
-                
-        except Exception as e:
-            print(f"Error processing slide {i+1}: {e}")
-    
+                    print(f"Slide {i+1}: No narration found")
+
+            except Exception as e:
+                print(f"Error processing slide {i+1}: {e}")
+
     return narration_dict
 
 def find_exported_slides():
@@ -73,22 +195,141 @@ def find_exported_slides():
     possible_dirs = ["uploaded_slides", "exported_slides", "manual_slides", "slide_exports", "slides"]
     
     for dir_name in possible_dirs:
-        if os.path.exists(dir_name):
-            png_files = [f for f in os.listdir(dir_name) if f.lower().endswith('.png')]
-            if png_files:
-                # Sort numerically instead of alphabetically
-                def natural_sort_key(filename):
-                    # Extract numbers from filename for proper sorting
-                    numbers = re.findall(r'\d+', filename)
-                    if numbers:
-                        return int(numbers[0])  # Sort by first number found
-                    return 0
-                
-                png_files.sort(key=natural_sort_key)
-                return dir_name, png_files
-    
+        try:
+            # scandir caches the file type on the DirEntry, so this is one
+            # syscall per directory instead of exists + listdir + stats
+            with os.scandir(dir_name) as it:
+                png_files = [e.name for e in it
+                             if e.is_file() and e.name.lower().endswith('.png')]
+        except OSError:
+            continue
+        if png_files:
+            # Sort numerically instead of alphabetically
+            png_files.sort(key=lambda f: int(m.group()) if (m := _NUM_RE.search(f)) else 0)
+            return dir_name, png_files
+
     return None, []
 
+def get_audio_duration(audio_path):
+    """Read an audio file's duration without decoding the samples"""
+    if audio_path.endswith('.wav'):
+        # WAV carries the frame count in its header
+        with wave.open(audio_path, 'rb') as wav_file:
+            return wav_file.getnframes() / float(wav_file.getframerate())
+    # Compressed formats (MP3 narration): ask ffprobe for the container duration
+    result = subprocess.run(
+        ["ffprobe", "-v", "error", "-show_entries", "format=duration",
+         "-of", "default=noprint_wrappers=1:nokey=1", audio_path],
+        capture_output=True, text=True, timeout=30)
+    return float(result.stdout.strip())
+
+def letterbox_frame(slide_img):
+    """Fit an image onto a white 1280x720 canvas and return raw RGB24 bytes"""
+    # draft lets JPEG-like decoders downscale during decode (no-op for PNG),
+    # and converting to RGB up front keeps paste off the palette/alpha path
+    slide_img.draft("RGB", (1280, 720))
+    if slide_img.mode != "RGB":
+        slide_img = slide_img.convert("RGB")
+    # Exporters usually emit slides at the video frame size already, so the
+    # common case skips the resize/letterbox entirely
+    if slide_img.size == (1280, 720):
+        return slide_img.tobytes()
+    # Oversized exports (2x the frame or more) get a cheap integer box
+    # reduce first, so the quality kernel below only touches the pixels
+    # that survive - same decode-reduce-then-resize split as process_slide
+    factor = max(1, min(slide_img.width // 1280, slide_img.height // 720))
+    if factor > 1:
+        slide_img = slide_img.reduce(factor)
+    # Pick the resampling kernel by scale: heavy downscales need LANCZOS to
+    # avoid aliasing, mild ones look identical with the much cheaper BILINEAR
+    scale = min(1280 / slide_img.width, 720 / slide_img.height)
+    resample = (Image.Resampling.LANCZOS if scale < 0.5
+                else Image.Resampling.BILINEAR)
+    # ImageOps.pad fuses the resize and the centered white letterbox into one
+    # operation - one pass over the pixels instead of thumbnail + new + paste
+    # (pillow-simd accelerates the resampling kernels when installed)
+    canvas = ImageOps.pad(slide_img, (1280, 720), method=resample,
+                          color=(255, 255, 255))
+    return canvas.tobytes()
+
+def encode_slide_clip(frame, duration, output_path, audio_path=None, pause=0.0):
+    """
+    Encode one still-frame clip with optional delayed narration audio
+
+    The frame goes to ffmpeg over stdin as a single raw RGB24 image, so
+    there is no per-frame Python work. Silent clips get an anullsrc audio
+    track so every clip carries identical streams and the final assembly
+    can stream-copy instead of re-encoding.
+
+    Args:
+        frame (bytes): Raw RGB24 data for the 1280x720 frame
+        duration (float): Total clip length in seconds (pause + narration)
+        output_path (str): Where to write the clip MP4
+        audio_path (str): Optional WAV with the narration audio
+        pause (float): Seconds of silence before the narration starts
+
+    Returns:
+        bool: True if the clip was encoded successfully
+    """
+    cmd = ["ffmpeg", "-y",
+           "-f", "rawvideo", "-pix_fmt", "rgb24", "-s", "1280x720",
+           "-framerate", str(1.0 / duration), "-i", "-"]
+    if audio_path:
+        cmd += ["-i", audio_path,
+                "-af", f"adelay={int(pause * 1000)}:all=1,apad"]
+    else:
+        cmd += ["-f", "lavfi", "-i", "anullsrc=r=44100:cl=mono"]
+    cmd += ["-t", f"{duration:.3f}",
+            "-c:v", "libx264", "-preset", "ultrafast", "-tune", "stillimage",
+            "-pix_fmt", "yuv420p", "-r", "24",
+            "-c:a", "aac", "-ar", "44100",
+            output_path]
+
+    try:
+        process = subprocess.Popen(cmd, stdin=subprocess.PIPE,
+                                   stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+        _, stderr = process.communicate(input=frame, timeout=300)
+    except Exception as e:
+        print(f"ffmpeg clip encode failed: {e}")
+        return False
+
+    if process.returncode != 0:
+        print(f"ffmpeg clip encode failed: {stderr.decode(errors='replace')}")
+        return False
+    return True
+
+def concat_stream_copy(clip_paths, output_path):
+    """
+    Concatenate already-encoded MP4 clips without re-encoding
+
+    All clips share the same codecs/parameters (see encode_slide_clip), so
+    the concat demuxer can stream-copy them - the final assembly is an
+    O(file size) copy instead of an O(frames) re-encode.
+
+    Args:
+        clip_paths (list): Paths of the clips, in playback order
+        output_path (str): Where to write the combined video
+
+    Returns:
+        bool: True if the concat succeeded
+    """
+    concat_list_path = "slide_images/concat.txt"
+    with open(concat_list_path, "w") as f:
+        for clip_path in clip_paths:
+            f.write(f"file '{os.path.abspath(clip_path)}'\n")
+
+    cmd = ["ffmpeg", "-y", "-f", "concat", "-safe", "0",
+           "-i", concat_list_path, "-c", "copy", output_path]
+    result = subprocess.run(cmd, capture_output=True, text=True, timeout=600)
+
+    if os.path.exists(concat_list_path):
+        os.remove(concat_list_path)
+
+    if result.returncode != 0:
+        print(f"ffmpeg concat failed: {result.stderr}")
+        return False
+    return True
+
 def main():
     """Main function to convert PowerPoint to video with Azure Speech narration"""
     try:
@@ -105,12 +346,16 @@ def main():
             print("Please check the POWERPOINT_FILE setting in your .env file")
             return False
 
-        presentation = Presentation(pptx_file)
-        print(f"Loaded presentation with {len(presentation.slides)} slides")
-
-        # Extract narration from PowerPoint slide notes
-        print(f"\nExtracting narration from PowerPoint slide notes...")
-        narration_notes = extract_narration_from_slides(presentation)
+        # Skip the XML parse entirely when a cached extraction from a
+        # previous run matches the file's current mtime
+        narration_notes = load_narration_cache(pptx_file)
+        if narration_notes is not None:
+            print("Using cached narration notes (presentation unchanged)")
+        else:
+            # Extract narration from PowerPoint slide notes
+            print(f"\nExtracting narration from PowerPoint slide notes...")
+            narration_notes = extract_narration_from_slides(pptx_file)
+            save_narration_cache(pptx_file, narration_notes)
 
         if not narration_notes:
             print("Warning: No narration found in slide notes. Videos will be silent.")
@@ -130,213 +375,171 @@ def main():
         os.makedirs("audio_clips", exist_ok=True)
         os.makedirs("slide_images", exist_ok=True)
 
-        # Process slides and generate audio
-        video_clips = []
+        # Resolve narration for every slide up front so all the audio can be
+        # synthesized in one concurrent batch instead of one slide at a time
+        slide_narrations = []
+        for i in range(len(slide_files)):
+            # Narration is keyed by slide number (slide_1, slide_2, ...);
+            # the extractor also stores title keys for compatibility, but
+            # the numbered key is always present when narration exists
+            slide_key = f"slide_{i+1}"
+            narration = narration_notes.get(slide_key, "")
+            if narration:
+                print(f"Found narration for slide {i+1} by number: {len(narration)} characters")
+            else:
+                print(f"No narration found for slide {i+1}")
+
+            slide_narrations.append(narration)
+
+        # Generate all narration audio concurrently (network-bound, so the
+        # requests overlap instead of paying Azure round-trip latency per slide)
+        batch_items = [(narration, f"audio_clips/audio_{i+1}{AUDIO_EXT}")
+                       for i, narration in enumerate(slide_narrations) if narration]
+        audio_ok = {}
+        if batch_items:
+            print(f"\nGenerating {len(batch_items)} audio clips with Azure Speech Services...")
+            # Keep the per-item success flags - a synthesis that fails after
+            # retries can still leave a partial file at the output path
+            batch_results = generate_audio_files_batch(batch_items)
+            audio_ok = {path: ok for (_, path), ok in zip(batch_items, batch_results)}
+
+        # Process slides and encode one MP4 clip per slide; the clips are
+        # stream-copied together at the end without re-encoding
         print("\nCreating video with Azure Speech Services audio...")
 
-        for i, slide_file in enumerate(slide_files):
+        def build_slide_clip(i):
+            """Letterbox slide i and encode its clip; returns (path, duration) or None"""
+            slide_file = slide_files[i]
             slide_path = os.path.join(slides_dir, slide_file)
-            print(f"\n--- Processing slide {i+1}/{len(slide_files)}: {slide_file} ---")
-            
+            print(f"--- Processing slide {i+1}/{len(slide_files)}: {slide_file} ---")
+
             try:
-                # Load the slide image
+                # Load the slide image and letterbox it to the video frame
                 slide_img = Image.open(slide_path)
-                print(f"Loaded slide image: {slide_img.size}")
-                
-                # Resize if needed to standard video dimensions
-                slide_img.thumbnail((1280, 720), Image.Resampling.LANCZOS)
-                
-                # Create a 1280x720 canvas and center the slide
-                canvas = Image.new("RGB", (1280, 720), color="white")
-                x_offset = (1280 - slide_img.width) // 2
-                y_offset = (720 - slide_img.height) // 2
-                canvas.paste(slide_img, (x_offset, y_offset))
-                
-                # Save the processed slide
-                processed_path = f"slide_images/processed_slide_{i+1}.png"
-                canvas.save(processed_path)
-                
-                # Get slide title and narration
-                slide = presentation.slides[i] if i < len(presentation.slides) else None
-                title = ""
-                narration = ""
-                
-                if slide and hasattr(slide, 'shapes') and slide.shapes.title:
-                    title = slide.shapes.title.text.strip()
-                
-                # Try multiple ways to find narration:
-                # 1. By slide number (slide_1, slide_2, etc.) - PREFERRED for uniqueness
-                # 2. By slide title (for compatibility, but can have duplicates)
-                slide_key = f"slide_{i+1}"
-                narration = narration_notes.get(slide_key, "")
-                if narration:
-                    print(f"Found narration for slide {i+1} by number: {len(narration)} characters")
-                elif title:
-                    narration = narration_notes.get(title, "")
-                    if narration:
-                        print(f"Found narration for '{title}' by title: {len(narration)} characters")
-                
-                if not narration:
-                    print(f"No narration found for slide {i+1} (title: '{title}')")
-                
-                if narration:
-                    # Generate audio using Azure Speech Services
-                    audio_path = f"audio_clips/audio_{i+1}.wav"
-                    audio_success = generate_audio_file(narration, audio_path)
-                    
-                    if audio_success and os.path.exists(audio_path):
-                        # Create slide with pause + narration
-                        audio_clip = AudioFileClip(audio_path)
-                        audio_duration = audio_clip.duration
-                        print(f"Audio duration: {audio_duration:.1f} seconds")
-                        
-                        # Create silent pause at the beginning (for reading the slide)
-                        silent_clip = ImageClip(processed_path).with_duration(pause_duration)
-                        print(f"Added {pause_duration}s reading pause before narration")
-                        
-                        # Create narrated portion
-                        narrated_clip = ImageClip(processed_path).with_duration(audio_duration).with_audio(audio_clip)
-                        
-                        # Combine pause + narration for this slide
-                        from moviepy import concatenate_videoclips
-                        slide_video = concatenate_videoclips([silent_clip, narrated_clip])
-                        
-                        total_duration = pause_duration + audio_duration
-                        video_clips.append(slide_video)
+                slide_frame = letterbox_frame(slide_img)
+
+                clip_path = f"slide_images/clip_{i+1}.mp4"
+
+                # Narration was resolved (and audio synthesized) in the batch pass above
+                narration = slide_narrations[i] if i < len(slide_narrations) else ""
+                audio_path = f"audio_clips/audio_{i+1}{AUDIO_EXT}"
+
+                if narration and audio_ok.get(audio_path) and os.path.exists(audio_path):
+                    # Slide with reading pause + narration
+                    audio_duration = get_audio_duration(audio_path)
+                    total_duration = pause_duration + audio_duration
+                    if encode_slide_clip(slide_frame, total_duration, clip_path,
+                                         audio_path=audio_path, pause=pause_duration):
                         print(f"Created slide {i+1}: {pause_duration}s pause + {audio_duration:.1f}s narration = {total_duration:.1f}s total")
-                    else:
-                        # Fallback: create clip without audio
-                        print("Audio generation failed, creating silent clip")
-                        duration = 5  # 5 seconds default
-                        image_clip = ImageClip(processed_path).with_duration(duration)
-                        video_clips.append(image_clip)
+                        return clip_path, total_duration
                 else:
-                    # No narration found, create short silent clip
-                    print(f"No narration found for slide {i+1}, creating short silent clip")
-                    duration = 3  # 3 seconds for slides without narration
-                    image_clip = ImageClip(processed_path).with_duration(duration)
-                    video_clips.append(image_clip)
-                
+                    if narration:
+                        print(f"Audio generation failed for slide {i+1}, creating silent clip")
+                        duration = 5  # 5 seconds default
+                    else:
+                        # No narration found, create short silent clip
+                        print(f"No narration found for slide {i+1}, creating short silent clip")
+                        duration = 3  # 3 seconds for slides without narration
+                    if encode_slide_clip(slide_frame, duration, clip_path):
+                        return clip_path, duration
+
             except Exception as e:
                 print(f"Error processing slide {i+1}: {e}")
+            return None
+
+        # Each slide's letterbox + clip encode is independent, so run them
+        # concurrently; the ffmpeg children do the heavy work outside the GIL
+        with ThreadPoolExecutor(max_workers=min(4, os.cpu_count() or 1)) as executor:
+            clip_results = list(executor.map(build_slide_clip, range(len(slide_files))))
+
+        clip_paths = [result[0] for result in clip_results if result]
+        clip_durations = [result[1] for result in clip_results if result]
 
         # Combine clips into final video
-        if video_clips:
-            print(f"\nCombining {len(video_clips)} slide clips into final video...")
+        if clip_paths:
+            print(f"\nCombining {len(clip_paths)} slide clips into final video...")
             print("Each slide now includes its own reading pause before narration")
-            
+
             # Add end slide (if enabled)
             if include_end_slide:
                 print("Adding end slide...")
                 try:
                     # Use the existing end slide image file
                     end_slide_path = "media/end-slide.png"
-                    
+
                     # Verify the file exists
                     if not os.path.exists(end_slide_path):
                         raise FileNotFoundError(f"End slide image not found: {end_slide_path}")
-                    
+
                     print(f"Using end slide image: {end_slide_path}")
-                    
+                    end_frame = letterbox_frame(Image.open(end_slide_path))
+                    end_clip_path = "slide_images/clip_end_slide.mp4"
+
                     # Generate narration for the end slide
                     end_slide_narration = "This video was generated from a PowerPoint presentation using Azure AI. For more information and source code, visit github.com/sdgilley/generate_movie"
-                    end_slide_audio_path = "audio_clips/audio_end_slide.wav"
-                    
+                    end_slide_audio_path = f"audio_clips/audio_end_slide{AUDIO_EXT}"
+
                     print("Generating audio for end slide...")
                     audio_success = generate_audio_file(end_slide_narration, end_slide_audio_path)
-                    
+
                     if audio_success and os.path.exists(end_slide_audio_path):
-                        # Create end slide with audio
-                        audio_clip = AudioFileClip(end_slide_audio_path)
-                        audio_duration = audio_clip.duration
+                        # End slide with reading pause + narration
+                        audio_duration = get_audio_duration(end_slide_audio_path)
                         print(f"End slide audio duration: {audio_duration:.1f} seconds")
-                        
-                        # Create silent pause at the beginning (for reading the slide)
-                        silent_end_clip = ImageClip(end_slide_path).with_duration(pause_duration)
-                        print(f"Added {pause_duration}s reading pause before end slide narration")
-                        
-                        # Create narrated portion
-                        narrated_end_clip = ImageClip(end_slide_path).with_duration(audio_duration).with_audio(audio_clip)
-                        
-                        # Combine pause + narration for end slide
-                        end_slide_video = concatenate_videoclips([silent_end_clip, narrated_end_clip])
-                        
+
                         total_end_duration = pause_duration + audio_duration
-                        video_clips.append(end_slide_video)
-                        print(f"End slide added to video ({pause_duration}s pause + {audio_duration:.1f}s narration = {total_end_duration:.1f}s total)")
+                        if encode_slide_clip(end_frame, total_end_duration, end_clip_path,
+                                             audio_path=end_slide_audio_path, pause=pause_duration):
+                            clip_paths.append(end_clip_path)
+                            clip_durations.append(total_end_duration)
+                            print(f"End slide added to video ({pause_duration}s pause + {audio_duration:.1f}s narration = {total_end_duration:.1f}s total)")
                     else:
                         # Fallback: create silent end slide (5 seconds duration)
                         print("Warning: Could not generate end slide audio, using silent version")
-                        end_slide_clip = ImageClip(end_slide_path).with_duration(5.0)
-                        video_clips.append(end_slide_clip)
-                        print("End slide added to video (5 seconds, silent)")
-                    
+                        if encode_slide_clip(end_frame, 5.0, end_clip_path):
+                            clip_paths.append(end_clip_path)
+                            clip_durations.append(5.0)
+                            print("End slide added to video (5 seconds, silent)")
+
                 except Exception as e:
                     print(f"Warning: Could not create end slide: {e}")
             else:
                 print("End slide skipped (INCLUDE_END_SLIDE=false)")
-            
-            # Combine all slide clips (no additional pauses needed)
-            final_video = concatenate_videoclips(video_clips, method="compose")
-            print("Video clips concatenated successfully")
 
+            # Combine all slide clips with a stream copy - no re-encode
             print(f"Writing final video file: {output_video_name}")
-            final_video.write_videofile(output_video_name, fps=24)
+            if not concat_stream_copy(clip_paths, output_video_name):
+                print("Failed to assemble final video!")
+                return False
             print("Final video file written successfully!")
 
             # Calculate total duration
-            total_duration = sum([clip.duration for clip in video_clips])
-            
+            total_duration = sum(clip_durations)
+
             print(f"\nVideo created successfully: {output_video_name}")
             print(f"Total duration: {total_duration:.1f} seconds ({total_duration/60:.1f} minutes)")
             print(f"Number of slides: {len(slide_files)}")
 
             # Cleanup
             print("Starting cleanup...")
-            # Close video clips to free memory
-            for clip in video_clips:
-                try:
-                    if hasattr(clip, 'close'):
-                        clip.close()
-                except:
-                    pass  # Ignore any cleanup errors
-            
-            try:
-                final_video.close()
-            except:
-                pass
-            
-            # Clean up intermediate files
+
+            # Clean up intermediate files - rmtree does the whole walk in C
+            # instead of a Python listdir/remove/print round per file
             print("Cleaning up intermediate files...")
-            
-            # Remove processed slide images (we keep the original exported slides)
-            if os.path.exists("slide_images"):
-                for file in os.listdir("slide_images"):
-                    file_path = os.path.join("slide_images", file)
-                    os.remove(file_path)
-                    print(f"Removed: {file_path}")
-                os.rmdir("slide_images")
-                print("Removed directory: slide_images/")
-            
+
+            # Remove processed slide clips (we keep the original exported slides)
+            shutil.rmtree("slide_images", ignore_errors=True)
+            print("Removed directory: slide_images/")
+
             # Keep audio files for now, user might want them
             # If you want to remove audio files too, uncomment below:
-            # if os.path.exists("audio_clips"):
-            #     for file in os.listdir("audio_clips"):
-            #         file_path = os.path.join("audio_clips", file)
-            #         os.remove(file_path)
-            #         print(f"Removed: {file_path}")
-            #     os.rmdir("audio_clips")
-            #     print("Removed directory: audio_clips/")
-            
+            # shutil.rmtree("audio_clips", ignore_errors=True)
+            # print("Removed directory: audio_clips/")
+
             # Remove test audio if it exists
-            if os.path.exists("test_audio"):
-                for file in os.listdir("test_audio"):
-                    file_path = os.path.join("test_audio", file)
-                    os.remove(file_path)
-                    print(f"Removed: {file_path}")
-                os.rmdir("test_audio")
-                print("Removed directory: test_audio/")
-            
+            shutil.rmtree("test_audio", ignore_errors=True)
+            print("Removed directory: test_audio/")
+
             print("Cleanup completed!")
             
         else: